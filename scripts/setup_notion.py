@@ -4,8 +4,9 @@ import os
 import re
 import sys
 import urllib.error
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
+from second_brain.adapters import _http
 from second_brain.config import load_dotenv
 
 
@@ -19,6 +20,7 @@ TARGET_ENV_KEYS = {
     "INBOX_LOG_DB",
     "COMPLETED_DB",
 }
+PAGE_ID_PATTERN = re.compile(r"[0-9a-fA-F]{32}")
 
 
 def _load_env_file(path: str) -> dict:
@@ -43,50 +45,44 @@ def _write_env_file(path: str, updates: dict) -> None:
         raise RuntimeError("Missing .env file.")
     with open(path, "r", encoding="utf-8") as handle:
         lines = handle.readlines()
-    updated = set()
+    remaining = dict(updates)
     output = []
     for line in lines:
         raw = line.strip()
-        if not raw or raw.startswith("#") or "=" not in raw:
-            output.append(line)
-            continue
-        key, _ = raw.split("=", 1)
-        key = key.strip()
-        if key in updates:
-            value = updates[key]
-            if " " in value:
-                value = f"\"{value}\""
-            output.append(f"{key}={value}\n")
-            updated.add(key)
-        else:
-            output.append(line)
-    missing = [key for key in updates.keys() if key not in updated]
-    for key in missing:
-        value = updates[key]
-        if " " in value:
-            value = f"\"{value}\""
-        output.append(f"{key}={value}\n")
+        if raw and not raw.startswith("#") and "=" in raw:
+            key = raw.split("=", 1)[0].strip()
+            if key in remaining:
+                output.append(f"{key}={_quote_env_value(remaining.pop(key))}\n")
+                continue
+        output.append(line)
+    output.extend(f"{key}={_quote_env_value(value)}\n" for key, value in remaining.items())
     with open(path, "w", encoding="utf-8") as handle:
         handle.writelines(output)
 
 
+def _quote_env_value(value: str) -> str:
+    if " " in value:
+        return f"\"{value}\""
+    return value
+
+
 def _normalize_page_id(value: str) -> str:
     value = value.strip()
-    match = re.findall(r"[0-9a-fA-F]{32}", value.replace("-", ""))
+    match = PAGE_ID_PATTERN.search(value.replace("-", ""))
     if match:
-        return match[0]
+        return match.group(0)
     return value
 
 
 def _request(token: str, url: str, payload: dict) -> dict:
     body = json.dumps(payload).encode("utf-8")
-    request = urllib.request.Request(url, data=body, method="POST")
-    request.add_header("Authorization", f"Bearer {token}")
-    request.add_header("Notion-Version", "2022-06-28")
-    request.add_header("Content-Type", "application/json")
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Notion-Version": "2022-06-28",
+        "Content-Type": "application/json",
+    }
     try:
-        with urllib.request.urlopen(request) as response:
-            return json.loads(response.read().decode("utf-8"))
+        return json.loads(_http.request("POST", url, body=body, headers=headers, timeout=30))
     except urllib.error.HTTPError as exc:
         body_text = exc.read().decode("utf-8") if exc.fp else ""
         raise RuntimeError(f"Notion HTTP {exc.code}: {body_text}") from exc
@@ -191,10 +187,16 @@ def main() -> int:
         ),
     ]
 
+    def _create(spec: tuple) -> dict:
+        name, _, props = spec
+        return _request(token, "https://api.notion.com/v1/databases", _db_payload(name, props, parent_id))
+
+    # The databases are independent, so create them concurrently.
+    with ThreadPoolExecutor(max_workers=len(db_specs)) as executor:
+        responses = list(executor.map(_create, db_specs))
+
     created = {}
-    for name, env_key, props in db_specs:
-        payload = _db_payload(name, props, parent_id)
-        response = _request(token, "https://api.notion.com/v1/databases", payload)
+    for (name, env_key, _), response in zip(db_specs, responses):
         db_id = response.get("id", "").strip()
         if not db_id:
             print(f"Failed to create {name} database.")
@@ -0,0 +1,24 @@
+"""File helpers shared by the local JSON adapters."""
+from __future__ import annotations
+
+import os
+import threading
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers never see a half-written file.
+
+    No fsync: these files are rewritten often, and a crash can at worst lose
+    the latest write, never truncate the previous one.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
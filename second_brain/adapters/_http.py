@@ -0,0 +1,155 @@
+"""Keep-alive HTTPS connections shared by the API adapters.
+
+``urllib.request.urlopen`` opens a fresh TCP+TLS connection per call. This
+module keeps idle connections per host so back-to-back API calls reuse them.
+Requests that go through a proxy, and redirected responses, are handed to
+``urlopen`` so proxy settings and redirect handling behave as before.
+"""
+from __future__ import annotations
+
+import http.client
+import io
+import select
+import ssl
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+MAX_IDLE_PER_HOST = 16
+RETRY_STATUSES = frozenset({429, 502, 503})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+# Requests that are safe to send twice; urlopen likewise only follows redirects for GET/HEAD.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PATCH"})
+REDIRECT_METHODS = frozenset({"GET", "HEAD"})
+MAX_RETRY_AFTER = 30.0
+
+_POOL: Dict[Tuple[str, int, int], List[http.client.HTTPSConnection]] = {}
+_LOCK = threading.Lock()
+_DEFAULT_CONTEXT: Optional[ssl.SSLContext] = None
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+def default_context() -> ssl.SSLContext:
+    global _DEFAULT_CONTEXT
+    if _DEFAULT_CONTEXT is None:
+        _DEFAULT_CONTEXT = ssl.create_default_context()
+    return _DEFAULT_CONTEXT
+
+
+def request(
+    method: str,
+    url: str,
+    body: Optional[bytes] = None,
+    headers: Optional[dict] = None,
+    context: Optional[ssl.SSLContext] = None,
+    timeout: float = 8,
+) -> bytes:
+    """Send a request over a pooled connection and return the response body.
+
+    Raises ``urllib.error.HTTPError`` for 4xx/5xx responses so callers can keep
+    their existing error handling.
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    context = context or default_context()
+    host = parts.hostname or ""
+    if _uses_proxy(host):
+        return _urlopen(method, url, body, headers, context, timeout)
+    port = parts.port or 443
+    key = (host, port, id(context))
+    for attempt in range(2):
+        conn, reused = _acquire(key, host, port, context, timeout)
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            sent = True
+            response = conn.getresponse()
+            data = response.read()
+        except _STALE_ERRORS:
+            conn.close()
+            # The server may have dropped an idle keep-alive socket; retry once fresh,
+            # unless the request was sent and resending could apply it twice.
+            if reused and attempt == 0 and (not sent or method in IDEMPOTENT_METHODS):
+                continue
+            raise
+        except Exception:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            _release(key, conn)
+        if response.status in REDIRECT_STATUSES and method in REDIRECT_METHODS:
+            return _urlopen(method, url, body, headers, context, timeout)
+        # Like urlopen, other redirects are not followed and surface as HTTPError.
+        if response.status >= 400 or response.status in REDIRECT_STATUSES:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(data))
+        return data
+    raise RuntimeError(f"Request to {url} failed.")
+
+
+def retry_delay(exc: urllib.error.HTTPError, backoff: float, attempt: int) -> float:
+    """Seconds to wait before retrying ``exc``, honouring a numeric Retry-After."""
+    retry_after = exc.headers.get("Retry-After") if exc.headers else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return backoff * (2**attempt)
+
+
+def _uses_proxy(host: str) -> bool:
+    # Same lookup urlopen's ProxyHandler does: HTTPS_PROXY etc., minus NO_PROXY.
+    return bool(urllib.request.getproxies().get("https")) and not urllib.request.proxy_bypass(host)
+
+
+def _urlopen(
+    method: str, url: str, body: Optional[bytes], headers: Optional[dict], context: ssl.SSLContext, timeout: float
+) -> bytes:
+    request = urllib.request.Request(url, data=body, headers=headers or {}, method=method)
+    with urllib.request.urlopen(request, context=context, timeout=timeout) as response:
+        return response.read()
+
+
+def _acquire(
+    key: Tuple[str, int, int], host: str, port: int, context: ssl.SSLContext, timeout: float
+) -> Tuple[http.client.HTTPSConnection, bool]:
+    while True:
+        with _LOCK:
+            idle = _POOL.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=context), False
+        if not _is_dropped(conn):
+            break
+        conn.close()
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _is_dropped(conn: http.client.HTTPSConnection) -> bool:
+    # An idle socket is readable only once the server has closed it (EOF or a
+    # TLS close_notify), so drop it before sending rather than after.
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _release(key: Tuple[str, int, int], conn: http.client.HTTPSConnection) -> None:
+    with _LOCK:
+        idle = _POOL.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
@@ -5,9 +5,9 @@ import os
 import ssl
 import time
 import urllib.error
-import urllib.request
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, Optional
 
+from second_brain.adapters import _http
 from second_brain.core.interfaces import AIProvider
 from second_brain.core.models import ClassificationResult, DigestSummary, StoredRecord
 from second_brain.core.prompts import CLASSIFICATION_PROMPT, DAILY_DIGEST_PROMPT, WEEKLY_DIGEST_PROMPT
@@ -27,10 +27,14 @@ class AnthropicProvider(AIProvider):
         self.ca_bundle = ca_bundle or os.environ.get("SSL_CERT_FILE")
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self._ssl_context = None
+        if self.ca_bundle and os.path.exists(self.ca_bundle):
+            self._ssl_context = ssl.create_default_context(cafile=self.ca_bundle)
+        self._body_prefixes: Dict[str, bytes] = {}
 
     def classify(self, text: str) -> ClassificationResult:
         payload = self._chat(CLASSIFICATION_PROMPT, text)
-        content = payload.get("content", [{}])[0].get("text", "{}").strip()
+        content = _content_text(payload, "{}")
         data = json.loads(content)
         return ClassificationResult(
             category=data.get("category", "admin"),
@@ -51,39 +55,52 @@ class AnthropicProvider(AIProvider):
     def _summarize(self, records: Iterable[StoredRecord], prompt: str) -> str:
         text = _records_to_text(records)
         payload = self._chat(prompt, text)
-        return payload.get("content", [{}])[0].get("text", "").strip()
+        return _content_text(payload, "")
 
     def _chat(self, system_prompt: str, user_text: str) -> dict:
         url = "https://api.anthropic.com/v1/messages"
-        body = json.dumps(
-            {
-                "model": self.model,
-                "max_tokens": 512,
-                "system": system_prompt,
-                "messages": [{"role": "user", "content": user_text}],
-            }
-        ).encode("utf-8")
-        request = urllib.request.Request(url, data=body, method="POST")
-        request.add_header("x-api-key", self.api_key)
-        request.add_header("anthropic-version", "2023-06-01")
-        request.add_header("Content-Type", "application/json")
-        context = None
-        if self.ca_bundle and os.path.exists(self.ca_bundle):
-            context = ssl.create_default_context(cafile=self.ca_bundle)
+        messages = json.dumps([{"role": "user", "content": user_text}], ensure_ascii=False)
+        body = self._body_prefix(system_prompt) + messages.encode("utf-8") + b"}"
+        headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json",
+        }
         for attempt in range(self.max_retries + 1):
             try:
-                with urllib.request.urlopen(request, context=context, timeout=8) as response:
-                    return json.loads(response.read().decode("utf-8"))
+                data = _http.request("POST", url, body=body, headers=headers, context=self._ssl_context, timeout=8)
+                return json.loads(data)
             except urllib.error.HTTPError as exc:
-                if exc.code == 429 and attempt < self.max_retries:
-                    time.sleep(self.retry_backoff * (2**attempt))
+                if exc.code in _http.RETRY_STATUSES and attempt < self.max_retries:
+                    time.sleep(_http.retry_delay(exc, self.retry_backoff, attempt))
                     continue
                 body = exc.read().decode("utf-8") if exc.fp else ""
                 raise RuntimeError(f"Anthropic HTTP {exc.code}: {body}") from exc
 
+    def _body_prefix(self, system_prompt: str) -> bytes:
+        # The model and system prompt are fixed, so encode that part of the body once.
+        prefix = self._body_prefixes.get(system_prompt)
+        if prefix is None:
+            head = json.dumps(
+                {"model": self.model, "max_tokens": 512, "system": system_prompt},
+                ensure_ascii=False,
+            )
+            prefix = self._body_prefixes[system_prompt] = (head[:-1] + ', "messages": ').encode("utf-8")
+        return prefix
+
+
+def _content_text(payload: dict, default: str) -> str:
+    try:
+        return payload["content"][0]["text"].strip()
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return default
+
 
 def _records_to_text(records: Iterable[StoredRecord]) -> str:
-    lines = []
-    for record in records:
-        lines.append(f"{record.category}: {record.title} :: {record.fields}")
-    return "\n".join(lines) or "No recent items."
+    return "\n".join(
+        f"{record.category}: {record.title} :: {_fields_json(record.fields)}" for record in records
+    ) or "No recent items."
+
+
+def _fields_json(fields: dict) -> str:
+    return json.dumps(fields, ensure_ascii=False, separators=(",", ":"), default=str)
@@ -5,9 +5,9 @@ import os
 import ssl
 import time
 import urllib.error
-import urllib.request
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, Optional
 
+from second_brain.adapters import _http
 from second_brain.core.interfaces import AIProvider
 from second_brain.core.models import ClassificationResult, DigestSummary, StoredRecord
 from second_brain.core.prompts import CLASSIFICATION_PROMPT, DAILY_DIGEST_PROMPT, WEEKLY_DIGEST_PROMPT
@@ -27,13 +27,14 @@ class OpenAIProvider(AIProvider):
         self.ca_bundle = ca_bundle or os.environ.get("SSL_CERT_FILE")
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self._ssl_context = None
+        if self.ca_bundle and os.path.exists(self.ca_bundle):
+            self._ssl_context = ssl.create_default_context(cafile=self.ca_bundle)
+        self._body_prefixes: Dict[str, bytes] = {}
 
     def classify(self, text: str) -> ClassificationResult:
-        payload = self._chat([
-            {"role": "system", "content": CLASSIFICATION_PROMPT},
-            {"role": "user", "content": text},
-        ])
-        content = payload.get("choices", [{}])[0].get("message", {}).get("content", "{}").strip()
+        payload = self._chat(CLASSIFICATION_PROMPT, text)
+        content = _message_content(payload, "{}")
         data = json.loads(content)
         return ClassificationResult(
             category=data.get("category", "admin"),
@@ -45,45 +46,59 @@ class OpenAIProvider(AIProvider):
 
     def summarize_daily(self, records: Iterable[StoredRecord]) -> DigestSummary:
         text = _records_to_text(records)
-        payload = self._chat([
-            {"role": "system", "content": DAILY_DIGEST_PROMPT},
-            {"role": "user", "content": text},
-        ])
-        body = payload.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
+        payload = self._chat(DAILY_DIGEST_PROMPT, text)
+        body = _message_content(payload, "")
         return DigestSummary(title="Daily Digest", body=body, word_count=len(body.split()))
 
     def summarize_weekly(self, records: Iterable[StoredRecord]) -> DigestSummary:
         text = _records_to_text(records)
-        payload = self._chat([
-            {"role": "system", "content": WEEKLY_DIGEST_PROMPT},
-            {"role": "user", "content": text},
-        ])
-        body = payload.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
+        payload = self._chat(WEEKLY_DIGEST_PROMPT, text)
+        body = _message_content(payload, "")
         return DigestSummary(title="Weekly Review", body=body, word_count=len(body.split()))
 
-    def _chat(self, messages: List[dict]) -> dict:
+    def _chat(self, system_prompt: str, user_text: str) -> dict:
         url = "https://api.openai.com/v1/chat/completions"
-        body = json.dumps({"model": self.model, "messages": messages}).encode("utf-8")
-        request = urllib.request.Request(url, data=body, method="POST")
-        request.add_header("Authorization", f"Bearer {self.api_key}")
-        request.add_header("Content-Type", "application/json")
-        context = None
-        if self.ca_bundle and os.path.exists(self.ca_bundle):
-            context = ssl.create_default_context(cafile=self.ca_bundle)
+        user_message = json.dumps({"role": "user", "content": user_text}, ensure_ascii=False)
+        body = self._body_prefix(system_prompt) + user_message.encode("utf-8") + b"]}"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
         for attempt in range(self.max_retries + 1):
             try:
-                with urllib.request.urlopen(request, context=context, timeout=8) as response:
-                    return json.loads(response.read().decode("utf-8"))
+                data = _http.request("POST", url, body=body, headers=headers, context=self._ssl_context, timeout=8)
+                return json.loads(data)
             except urllib.error.HTTPError as exc:
-                if exc.code == 429 and attempt < self.max_retries:
-                    time.sleep(self.retry_backoff * (2**attempt))
+                if exc.code in _http.RETRY_STATUSES and attempt < self.max_retries:
+                    time.sleep(_http.retry_delay(exc, self.retry_backoff, attempt))
                     continue
                 body = exc.read().decode("utf-8") if exc.fp else ""
                 raise RuntimeError(f"OpenAI HTTP {exc.code}: {body}") from exc
 
+    def _body_prefix(self, system_prompt: str) -> bytes:
+        # The model and system prompt are fixed, so encode that part of the body once.
+        prefix = self._body_prefixes.get(system_prompt)
+        if prefix is None:
+            head = json.dumps(
+                {"model": self.model, "messages": [{"role": "system", "content": system_prompt}]},
+                ensure_ascii=False,
+            )
+            prefix = self._body_prefixes[system_prompt] = (head[:-2] + ",").encode("utf-8")
+        return prefix
+
+
+def _message_content(payload: dict, default: str) -> str:
+    try:
+        return payload["choices"][0]["message"]["content"].strip()
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return default
+
 
 def _records_to_text(records: Iterable[StoredRecord]) -> str:
-    lines = []
-    for record in records:
-        lines.append(f"{record.category}: {record.title} :: {record.fields}")
-    return "\n".join(lines) or "No recent items."
+    return "\n".join(
+        f"{record.category}: {record.title} :: {_fields_json(record.fields)}" for record in records
+    ) or "No recent items."
+
+
+def _fields_json(fields: dict) -> str:
+    return json.dumps(fields, ensure_ascii=False, separators=(",", ":"), default=str)
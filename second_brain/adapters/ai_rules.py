@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from itertools import islice
 from typing import Iterable, List
 
 from second_brain.core.models import ClassificationResult, DigestSummary, StoredRecord
@@ -14,20 +15,27 @@ CATEGORY_KEYWORDS = {
     "ideas": ["idea", "what if", "maybe", "concept", "hypothesis"],
     "admin": ["pay", "invoice", "renew", "schedule", "submit", "todo", "task"],
 }
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Flattened once so scoring is a single loop of C-level substring searches,
+# which beats a combined regex for this many short keywords.
+_KEYWORD_TABLE = tuple(
+    (keyword, category) for category, keywords in CATEGORY_KEYWORDS.items() for keyword in keywords
+)
 
 
 def _simple_title(text: str, max_words: int = 6) -> str:
-    words = re.findall(r"\w+", text)
-    return " ".join(words[:max_words]) if words else "Untitled"
+    # Stop scanning after max_words matches instead of tokenizing the whole capture.
+    words = [match.group() for match in islice(_WORD_PATTERN.finditer(text), max_words)]
+    return " ".join(words) if words else "Untitled"
 
 
 def _best_category(text: str) -> tuple[str, float]:
     text_lower = text.lower()
     scores = {"people": 0, "projects": 0, "ideas": 0, "admin": 0}
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                scores[category] += 1
+    for keyword, category in _KEYWORD_TABLE:
+        if keyword in text_lower:
+            scores[category] += 1
     best = max(scores, key=scores.get)
     score = scores[best]
     if score == 0:
@@ -91,7 +99,4 @@ class RuleBasedAI(AIProvider):
 def _summarize_records(records: List[StoredRecord], max_items: int) -> str:
     if not records:
         return "No items filed recently."
-    lines = []
-    for record in records[:max_items]:
-        lines.append(f"- {record.category}: {record.title}")
-    return "\n".join(lines)
+    return "\n".join(f"- {record.category}: {record.title}" for record in records[:max_items])
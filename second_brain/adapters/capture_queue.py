@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import List
 from uuid import uuid4
 
+from second_brain.adapters._files import atomic_write
 from second_brain.core.interfaces import CaptureAdapter
 from second_brain.core.models import CaptureItem
 
@@ -21,9 +22,11 @@ class QueueCapture(CaptureAdapter):
             "source": source,
             "created_at": created_at.isoformat(),
         }
-        items = self._read_queue()
-        items.append(payload)
-        self._write_queue(items)
+        if self._is_legacy_queue():
+            self._write_queue(self._read_queue())
+        self._ensure_dir()
+        with open(self.queue_path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(payload) + "\n")
 
     def fetch(self) -> List[CaptureItem]:
         items = self._read_queue()
@@ -45,11 +48,24 @@ class QueueCapture(CaptureAdapter):
         if not os.path.exists(self.queue_path):
             return []
         with open(self.queue_path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
+            if handle.read(1) == "[":
+                handle.seek(0)
+                return json.load(handle)
+            handle.seek(0)
+            return [json.loads(line) for line in handle if line.strip()]
 
     def _write_queue(self, items: List[dict]) -> None:
+        self._ensure_dir()
+        atomic_write(self.queue_path, "".join(json.dumps(item) + "\n" for item in items).encode("utf-8"))
+
+    def _is_legacy_queue(self) -> bool:
+        # Queues written before the JSONL format were a single JSON array.
+        if not os.path.exists(self.queue_path):
+            return False
+        with open(self.queue_path, "r", encoding="utf-8") as handle:
+            return handle.read(1) == "["
+
+    def _ensure_dir(self) -> None:
         dir_name = os.path.dirname(self.queue_path)
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
-        with open(self.queue_path, "w", encoding="utf-8") as handle:
-            json.dump(items, handle, indent=2)
@@ -4,10 +4,11 @@ import json
 import os
 import urllib.error
 import urllib.parse
-import urllib.request
 from datetime import datetime
 from typing import List, Optional
 
+from second_brain.adapters import _http
+from second_brain.adapters._files import atomic_write
 from second_brain.core.interfaces import CaptureAdapter
 from second_brain.core.models import CaptureItem
 
@@ -31,58 +32,65 @@ class SlackCapture(CaptureAdapter):
         }
         if latest:
             params["oldest"] = latest
+
+        items: List[CaptureItem] = []
+        newest = latest
+        while True:
+            payload = self._history_page(params)
+            for msg in payload.get("messages", []):
+                if msg.get("subtype"):
+                    continue
+                ts = msg.get("ts")
+                text = msg.get("text", "").strip()
+                if not text:
+                    continue
+                created_at = datetime.utcfromtimestamp(float(ts))
+                items.append(
+                    CaptureItem(
+                        item_id=ts,
+                        text=text,
+                        source="slack",
+                        created_at=created_at,
+                        raw=msg,
+                    )
+                )
+                if not newest or float(ts) > float(newest):
+                    newest = ts
+            next_cursor = (payload.get("response_metadata") or {}).get("next_cursor")
+            if not payload.get("has_more") or not next_cursor:
+                break
+            params["cursor"] = next_cursor
+
+        if newest:
+            self._save_cursor(newest)
+        return items
+
+    def _history_page(self, params: dict) -> dict:
         url = "https://slack.com/api/conversations.history"
         query = urllib.parse.urlencode(params)
-        request = urllib.request.Request(f"{url}?{query}")
-        request.add_header("Authorization", f"Bearer {self.token}")
-        request.add_header("Content-Type", "application/x-www-form-urlencoded")
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
 
         try:
-            with urllib.request.urlopen(request, timeout=8) as response:
-                payload = json.loads(response.read().decode("utf-8"))
+            payload = json.loads(_http.request("GET", f"{url}?{query}", headers=headers, timeout=8))
         except urllib.error.HTTPError as exc:
             raise RuntimeError(f"Slack API error: {exc.code}") from exc
 
         if not payload.get("ok"):
             raise RuntimeError(f"Slack error: {payload.get('error', 'unknown')}")
-
-        messages = payload.get("messages", [])
-        items: List[CaptureItem] = []
-        newest = latest
-        for msg in messages:
-            if msg.get("subtype"):
-                continue
-            ts = msg.get("ts")
-            text = msg.get("text", "").strip()
-            if not text:
-                continue
-            created_at = datetime.utcfromtimestamp(float(ts))
-            items.append(
-                CaptureItem(
-                    item_id=ts,
-                    text=text,
-                    source="slack",
-                    created_at=created_at,
-                    raw=msg,
-                )
-            )
-            if not newest or float(ts) > float(newest):
-                newest = ts
-
-        if newest:
-            self._save_cursor(newest)
-        return items
+        return payload
 
     def _load_cursor(self) -> Optional[str]:
         if not os.path.exists(self.cursor_path):
             return None
-        with open(self.cursor_path, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        with open(self.cursor_path, "rb") as handle:
+            payload = json.loads(handle.read())
         return payload.get("latest")
 
     def _save_cursor(self, latest: str) -> None:
         dir_name = os.path.dirname(self.cursor_path)
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
-        with open(self.cursor_path, "w", encoding="utf-8") as handle:
-            json.dump({"latest": latest}, handle, indent=2)
+        atomic_write(self.cursor_path, json.dumps({"latest": latest}).encode("utf-8"))
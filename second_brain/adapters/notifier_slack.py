@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import json
 import urllib.parse
-import urllib.request
 
+from second_brain.adapters import _http
 from second_brain.core.interfaces import Notifier
 
 
@@ -11,6 +11,10 @@ class SlackNotifier(Notifier):
     def __init__(self, token: str, channel_id: str) -> None:
         self.token = token
         self.channel_id = channel_id
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
 
     def notify_filed(self, message: str) -> None:
         self._post(message)
@@ -24,10 +28,6 @@ class SlackNotifier(Notifier):
     def _post(self, text: str) -> None:
         url = "https://slack.com/api/chat.postMessage"
         payload = urllib.parse.urlencode({"channel": self.channel_id, "text": text}).encode("utf-8")
-        request = urllib.request.Request(url, data=payload, method="POST")
-        request.add_header("Authorization", f"Bearer {self.token}")
-        request.add_header("Content-Type", "application/x-www-form-urlencoded")
-        with urllib.request.urlopen(request, timeout=8) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        data = json.loads(_http.request("POST", url, body=payload, headers=self._headers, timeout=8))
         if not data.get("ok"):
             raise RuntimeError(f"Slack error: {data.get('error', 'unknown')}")
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import heapq
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
+from second_brain.adapters._files import atomic_write
 from second_brain.core.interfaces import StorageAdapter
 from second_brain.core.models import StoredRecord
 
 
+IO_BUFFER_SIZE = 1 << 20
+EPOCH = datetime(1970, 1, 1)
+
+
 class JsonStorage(StorageAdapter):
     def __init__(self, base_dir: str = "data", completed_table: str | None = None) -> None:
         self.base_dir = base_dir
         self.completed_table = completed_table
+        # Tables keyed by name with the (mtime_ns, size) they were read at, so
+        # repeated reads skip the parse until the file changes on disk.
+        self._cache: Dict[str, Tuple[Tuple[int, int], List[dict]]] = {}
+        self._title_index: Dict[str, Dict[str, List[str]]] = {}
 
     def store(self, category: str, record: dict) -> StoredRecord:
         record_id = str(uuid4())
@@ -22,110 +32,163 @@ class JsonStorage(StorageAdapter):
             "id": record_id,
             "category": category,
             "title": record.get("name") or record.get("title") or "Untitled",
-            "fields": record,
+            "fields": dict(record),
             "created_at": created_at.isoformat(),
+            "created_at_epoch": _epoch(created_at),
         }
-        items = self._read_table(category)
-        items.append(payload)
-        self._write_table(category, items)
+        self._write_table(category, [*self._read_table(category), payload])
+        self._index_add(category, payload["title"], record_id)
         return StoredRecord(
             category=category,
             record_id=record_id,
             title=payload["title"],
-            fields=record,
+            fields=dict(record),
             created_at=created_at,
         )
 
     def log_inbox(self, entry: dict) -> None:
-        items = self._read_table("inbox_log")
-        items.append(entry)
-        self._write_table("inbox_log", items)
+        self._write_table("inbox_log", [*self._read_table("inbox_log"), entry])
+        self._title_index.pop("inbox_log", None)
+
+    def log_inbox_batch(self, entries: List[dict]) -> None:
+        if not entries:
+            return
+        self._write_table("inbox_log", [*self._read_table("inbox_log"), *entries])
+        self._title_index.pop("inbox_log", None)
 
-    def list_records(self, categories: Iterable[str], days: Optional[int] = None) -> List[StoredRecord]:
-        results: List[StoredRecord] = []
+    def list_records(
+        self, categories: Iterable[str], days: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[StoredRecord]:
         cutoff = None
         if days is not None:
-            cutoff = datetime.utcnow() - timedelta(days=days)
+            cutoff = _epoch(datetime.utcnow() - timedelta(days=days))
+        # Filter and sort on the numeric epoch; only returned rows get a datetime.
+        rows: List[Tuple[float, dict]] = []
         for category in categories:
-            items = self._read_table(category)
-            for item in items:
-                created_at = datetime.fromisoformat(item["created_at"])
-                if cutoff and created_at < cutoff:
+            for item in self._read_table(category):
+                epoch = item.get("created_at_epoch")
+                if epoch is None:
+                    epoch = item["created_at_epoch"] = _epoch(datetime.fromisoformat(item["created_at"]))
+                if cutoff is not None and epoch < cutoff:
                     continue
-                results.append(
-                    StoredRecord(
-                        category=item["category"],
-                        record_id=item["id"],
-                        title=item["title"],
-                        fields=item.get("fields", {}),
-                        created_at=created_at,
-                    )
-                )
-        results.sort(key=lambda r: r.created_at, reverse=True)
-        return results
+                rows.append((epoch, item))
+        if limit is None:
+            rows.sort(key=lambda row: row[0], reverse=True)
+        else:
+            rows = heapq.nlargest(limit, rows, key=lambda row: row[0])
+        return [
+            StoredRecord(
+                category=item["category"],
+                record_id=item["id"],
+                title=item["title"],
+                fields=dict(item.get("fields", {})),
+                created_at=datetime.fromisoformat(item["created_at"]),
+            )
+            for _, item in rows
+        ]
 
     def find_record_by_title(self, category: str, title: str) -> str | None:
-        items = self._read_table(category)
-        match = None
-        for item in items:
-            if item.get("title") != title:
-                continue
-            if match is not None:
-                ids = [match.get("id"), item.get("id")]
-                raise RuntimeError(f"Multiple records match '{title}' in {category}: {ids}")
-            match = item
-        return match.get("id") if match else None
+        ids = self._titles(category).get(title)
+        if not ids:
+            return None
+        if len(ids) > 1:
+            raise RuntimeError(f"Multiple records match '{title}' in {category}: {ids}")
+        return ids[0]
 
     def update_record(self, category: str, record_id: str, fields: dict) -> StoredRecord:
         items = self._read_table(category)
-        for item in items:
-            if item.get("id") == record_id:
-                stored_fields = item.get("fields") or {}
-                stored_fields.update(fields)
-                item["fields"] = stored_fields
-                if "name" in fields and fields["name"]:
-                    item["title"] = str(fields["name"])
-                elif "title" in fields and fields["title"]:
-                    item["title"] = str(fields["title"])
-                target_category = category
-                if self.completed_table and _is_completed_status(item.get("fields", {})):
-                    item.setdefault("fields", {})["completed_date"] = datetime.utcnow().date().isoformat()
-                    target_category = self.completed_table
-                    items.remove(item)
-                    self._write_table(category, items)
-                    completed_items = self._read_table(target_category)
-                    item["category"] = target_category
-                    completed_items.append(item)
-                    self._write_table(target_category, completed_items)
-                else:
-                    self._write_table(category, items)
-                created_at = datetime.fromisoformat(item["created_at"])
-                return StoredRecord(
-                    category=item["category"],
-                    record_id=item["id"],
-                    title=item["title"],
-                    fields=item.get("fields", {}),
-                    created_at=created_at,
-                )
+        for position, current in enumerate(items):
+            if current.get("id") != record_id:
+                continue
+            old_title = current.get("title")
+            item = {**current, "fields": {**(current.get("fields") or {}), **fields}}
+            if "name" in fields and fields["name"]:
+                item["title"] = str(fields["name"])
+            elif "title" in fields and fields["title"]:
+                item["title"] = str(fields["title"])
+            if self.completed_table and _is_completed_status(item["fields"]):
+                item["fields"]["completed_date"] = datetime.utcnow().date().isoformat()
+                target_category = self.completed_table
+                self._write_table(category, [*items[:position], *items[position + 1 :]])
+                item["category"] = target_category
+                self._write_table(target_category, [*self._read_table(target_category), item])
+                self._index_remove(category, old_title, record_id)
+                self._index_add(target_category, item["title"], record_id)
+            else:
+                self._write_table(category, [*items[:position], item, *items[position + 1 :]])
+                if item["title"] != old_title:
+                    self._index_remove(category, old_title, record_id)
+                    self._index_add(category, item["title"], record_id)
+            return StoredRecord(
+                category=item["category"],
+                record_id=item["id"],
+                title=item["title"],
+                fields=dict(item["fields"]),
+                created_at=datetime.fromisoformat(item["created_at"]),
+            )
         raise RuntimeError(f"Record id {record_id} not found in {category}.")
 
+    # The cached list and its dicts are shared; callers build new ones and hand
+    # them to _write_table, which installs them only after the write succeeds.
     def _read_table(self, name: str) -> List[dict]:
         path = self._table_path(name)
-        if not os.path.exists(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._cache.pop(name, None)
+            self._title_index.pop(name, None)
             return []
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(name)
+        if cached and cached[0] == version:
+            return cached[1]
+        with open(path, "rb", buffering=IO_BUFFER_SIZE) as handle:
+            items = json.loads(handle.read())
+        self._cache[name] = (version, items)
+        self._title_index.pop(name, None)
+        return items
 
     def _write_table(self, name: str, items: List[dict]) -> None:
         os.makedirs(self.base_dir, exist_ok=True)
         path = self._table_path(name)
-        with open(path, "w", encoding="utf-8") as handle:
-            json.dump(items, handle, indent=2)
+        # indent=None keeps json.dumps on the C encoder; indented output is pure Python.
+        atomic_write(path, json.dumps(items, ensure_ascii=False).encode("utf-8"))
+        stat = os.stat(path)
+        self._cache[name] = ((stat.st_mtime_ns, stat.st_size), items)
+
+    def _titles(self, name: str) -> Dict[str, List[str]]:
+        items = self._read_table(name)
+        index = self._title_index.get(name)
+        if index is None:
+            index = {}
+            for item in items:
+                index.setdefault(item.get("title"), []).append(item.get("id"))
+            self._title_index[name] = index
+        return index
+
+    def _index_add(self, name: str, title: str, record_id: str) -> None:
+        # Only maintain an index that has already been built; otherwise _titles builds it lazily.
+        index = self._title_index.get(name)
+        if index is not None:
+            index.setdefault(title, []).append(record_id)
+
+    def _index_remove(self, name: str, title: str, record_id: str) -> None:
+        index = self._title_index.get(name)
+        ids = index.get(title) if index is not None else None
+        if ids and record_id in ids:
+            ids.remove(record_id)
+            if not ids:
+                del index[title]
 
     def _table_path(self, name: str) -> str:
         return os.path.join(self.base_dir, f"{name}.json")
 
 
+def _epoch(value: datetime) -> float:
+    # created_at values are naive UTC; datetime.timestamp() would treat them as local time.
+    return (value - EPOCH).total_seconds()
+
+
 def _is_completed_status(fields: dict) -> bool:
     value = fields.get("status") or fields.get("Status")
     if value is None:
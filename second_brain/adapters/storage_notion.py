@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import heapq
 import json
+import sys
+import time
 import urllib.error
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Iterable, List, Optional
 
+from second_brain.adapters import _http
 from second_brain.core.interfaces import StorageAdapter
 from second_brain.core.models import StoredRecord
 
+UTC = timezone.utc
+LOG_BATCH_WORKERS = 8
+PAGES_URL = "https://api.notion.com/v1/pages"
+# A 502/503 on a page create may still have created the page, so creates
+# only retry on 429, which Notion rejects before doing any work.
+CREATE_RETRY_STATUSES = frozenset({429})
+
+if sys.version_info >= (3, 11):
+    # 3.11+ parses Notion's trailing "Z" natively.
+    _parse_notion_time = datetime.fromisoformat
+else:
+
+    def _parse_notion_time(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class NotionStorage(StorageAdapter):
     """Writes records into Notion databases.
@@ -22,11 +41,23 @@ class NotionStorage(StorageAdapter):
         database_ids: dict,
         property_map: dict,
         completed_database_id: str | None = None,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
     ) -> None:
         self.token = token
         self.database_ids = database_ids
         self.property_map = property_map
         self.completed_database_id = completed_database_id
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Notion-Version": "2022-06-28",
+            "Content-Type": "application/json",
+        }
+        self._title_props = {
+            category: _get_title_property_name(mapping) for category, mapping in property_map.items()
+        }
 
     def store(self, category: str, record: dict) -> StoredRecord:
         database_id = self.database_ids.get(category)
@@ -34,9 +65,9 @@ class NotionStorage(StorageAdapter):
             raise RuntimeError(f"Missing Notion database id for {category}.")
         properties = _build_properties(record, self.property_map.get(category, {}))
         payload = {"parent": {"database_id": database_id}, "properties": properties}
-        response = self._request("https://api.notion.com/v1/pages", payload)
+        response = self._request(PAGES_URL, payload)
         title = record.get("name") or record.get("title") or "Untitled"
-        created_at = datetime.utcnow()
+        created_at = datetime.now(UTC)
         return StoredRecord(
             category=category,
             record_id=response.get("id", ""),
@@ -51,32 +82,62 @@ class NotionStorage(StorageAdapter):
             raise RuntimeError("Missing Notion database id for inbox_log.")
         properties = _build_properties(entry, self.property_map.get("inbox_log", {}))
         payload = {"parent": {"database_id": database_id}, "properties": properties}
-        self._request("https://api.notion.com/v1/pages", payload)
+        self._request(PAGES_URL, payload)
 
-    def list_records(self, categories: Iterable[str], days: Optional[int] = None) -> List[StoredRecord]:
-        results: List[StoredRecord] = []
+    def log_inbox_batch(self, entries: List[dict]) -> None:
+        # Notion has no bulk page create; overlap the round trips instead.
+        if len(entries) < 2:
+            super().log_inbox_batch(entries)
+            return
+        with ThreadPoolExecutor(max_workers=min(LOG_BATCH_WORKERS, len(entries))) as executor:
+            list(executor.map(self.log_inbox, entries))
+
+    def list_records(
+        self, categories: Iterable[str], days: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[StoredRecord]:
         cutoff = None
         if days is not None:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        for category in categories:
-            database_id = self.database_ids.get(category)
-            if not database_id:
-                continue
-            payload = {"page_size": 50}
+            cutoff = datetime.now(UTC) - timedelta(days=days)
+        categories = [category for category in categories if self.database_ids.get(category)]
+        results: List[StoredRecord] = []
+        if not categories:
+            return results
+        # Each category is a separate database query; run them concurrently.
+        with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+            for records in executor.map(lambda category: self._query_category(category, cutoff, limit), categories):
+                results.extend(records)
+        if limit is not None:
+            return heapq.nlargest(limit, results, key=lambda r: r.created_at)
+        results.sort(key=lambda r: r.created_at, reverse=True)
+        return results
+
+    def _query_category(
+        self, category: str, cutoff: Optional[datetime], limit: Optional[int] = None
+    ) -> List[StoredRecord]:
+        database_id = self.database_ids[category]
+        # Newest first, so paging can stop at the cutoff or once `limit` records are in.
+        if limit is not None and limit <= 0:
+            return []
+        payload = {
+            "page_size": 100 if limit is None else min(limit, 100),
+            "sorts": [{"timestamp": "created_time", "direction": "descending"}],
+        }
+        records: List[StoredRecord] = []
+        while True:
             response = self._request(
                 f"https://api.notion.com/v1/databases/{database_id}/query",
                 payload,
             )
             for item in response.get("results", []):
                 created = item.get("created_time")
-                created_at = datetime.fromisoformat(created.replace("Z", "+00:00"))
+                created_at = _parse_notion_time(created)
                 if cutoff and created_at < cutoff:
-                    continue
+                    return records
                 properties = item.get("properties", {})
-                title = properties.get("Name", {}).get("title", [])
+                title = properties.get(self._title_props.get(category, "Name"), {}).get("title", [])
                 title_text = title[0].get("plain_text") if title else "Untitled"
                 fields = _extract_fields(properties)
-                results.append(
+                records.append(
                     StoredRecord(
                         category=category,
                         record_id=item.get("id", ""),
@@ -85,14 +146,17 @@ class NotionStorage(StorageAdapter):
                         created_at=created_at,
                     )
                 )
-        results.sort(key=lambda r: r.created_at, reverse=True)
-        return results
+                if limit is not None and len(records) >= limit:
+                    return records
+            if not response.get("has_more") or not response.get("next_cursor"):
+                return records
+            payload["start_cursor"] = response["next_cursor"]
 
     def find_record_by_title(self, category: str, title: str) -> str | None:
         database_id = self.database_ids.get(category)
         if not database_id:
             raise RuntimeError(f"Missing Notion database id for {category}.")
-        title_prop = _get_title_property_name(self.property_map.get(category, {}))
+        title_prop = self._title_props.get(category, "Name")
         payload = {
             "page_size": 5,
             "filter": {
@@ -114,7 +178,7 @@ class NotionStorage(StorageAdapter):
 
     def update_record(self, category: str, record_id: str, fields: dict) -> StoredRecord:
         mapping = self.property_map.get(category, {})
-        properties = _build_properties_partial(fields, mapping)
+        properties = _build_properties(fields, mapping, partial=True)
         if not properties:
             raise RuntimeError("No valid fields to update.")
         payload = {"properties": properties}
@@ -148,7 +212,7 @@ class NotionStorage(StorageAdapter):
                         "parent": {"database_id": self.completed_database_id},
                         "properties": properties,
                     }
-                    created = self._request("https://api.notion.com/v1/pages", create_payload)
+                    created = self._request(PAGES_URL, create_payload)
                     self._request(
                         f"https://api.notion.com/v1/pages/{record_id}",
                         {"archived": True},
@@ -158,9 +222,9 @@ class NotionStorage(StorageAdapter):
             except Exception:
                 pass
         created = response.get("created_time")
-        created_at = datetime.fromisoformat(created.replace("Z", "+00:00")) if created else datetime.utcnow()
+        created_at = _parse_notion_time(created) if created else datetime.now(UTC)
         properties = response.get("properties", {})
-        title_prop = _get_title_property_name(mapping)
+        title_prop = self._title_props.get(category, "Name")
         title_value = properties.get(title_prop, {}).get("title", [])
         title_text = title_value[0].get("plain_text") if title_value else "Untitled"
         return StoredRecord(
@@ -174,68 +238,85 @@ class NotionStorage(StorageAdapter):
     def _request(self, url: str, payload: dict | None = None, method: str = "POST") -> dict:
         body = None
         if payload is not None:
-            body = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(url, data=body, method=method)
-        request.add_header("Authorization", f"Bearer {self.token}")
-        request.add_header("Notion-Version", "2022-06-28")
-        request.add_header("Content-Type", "application/json")
-        try:
-            with urllib.request.urlopen(request, timeout=8) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:
-            error_body = ""
+            body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if method == "POST" and url == PAGES_URL:
+            retry_statuses = CREATE_RETRY_STATUSES
+        else:
+            retry_statuses = _http.RETRY_STATUSES
+        for attempt in range(self.max_retries + 1):
             try:
-                if exc.fp is not None:
-                    error_body = exc.fp.read().decode("utf-8")
-            except Exception:
-                error_body = "<failed to read error body>"
-            print(
-                "Notion HTTPError",
-                {
-                    "status": exc.code,
-                    "reason": exc.reason,
-                    "url": url,
-                    "body": error_body,
-                },
-            )
-            raise
+                return json.loads(_http.request(method, url, body=body, headers=self._headers, timeout=8))
+            except urllib.error.HTTPError as exc:
+                if exc.code in retry_statuses and attempt < self.max_retries:
+                    time.sleep(_http.retry_delay(exc, self.retry_backoff, attempt))
+                    continue
+                error_body = ""
+                try:
+                    if exc.fp is not None:
+                        error_body = exc.fp.read().decode("utf-8")
+                except Exception:
+                    error_body = "<failed to read error body>"
+                print(
+                    "Notion HTTPError",
+                    {
+                        "status": exc.code,
+                        "reason": exc.reason,
+                        "url": url,
+                        "body": error_body,
+                    },
+                )
+                raise
+        raise RuntimeError(f"Notion request to {url} failed.")
+
+
+def _build_properties(record: dict, mapping: dict, partial: bool = False) -> dict:
+    """Serialize ``record`` into Notion properties using ``mapping``.
+
+    Full builds emit every mapped property (missing fields become empty);
+    partial builds emit only the fields in ``record`` and reject unmapped ones.
+    """
+    if partial:
+        pairs = []
+        for field, value in record.items():
+            prop = mapping.get(field)
+            if not prop:
+                raise RuntimeError(f"Unknown field '{field}' for Notion mapping.")
+            pairs.append((prop, value))
+    else:
+        pairs = [(prop, record.get(field, "")) for field, prop in mapping.items()]
+    return {prop["name"]: _serialize_property(prop.get("type", "rich_text"), value) for prop, value in pairs}
 
 
-def _build_properties(record: dict, mapping: dict) -> dict:
-    properties = {}
-    for field, prop in mapping.items():
-        value = record.get(field, "")
-        prop_type = prop.get("type", "rich_text")
-        properties[prop["name"]] = _serialize_property(prop_type, value)
-    return properties
+def _serialize_select(value: object) -> dict:
+    if value in (None, ""):
+        return {"select": None}
+    return {"select": {"name": str(value)}}
 
 
-def _build_properties_partial(record: dict, mapping: dict) -> dict:
-    properties = {}
-    for field, value in record.items():
-        prop = mapping.get(field)
-        if not prop:
-            raise RuntimeError(f"Unknown field '{field}' for Notion mapping.")
-        prop_type = prop.get("type", "rich_text")
-        properties[prop["name"]] = _serialize_property(prop_type, value)
-    return properties
+def _serialize_date(value: object) -> dict:
+    if value in (None, ""):
+        return {"date": None}
+    return {"date": {"start": str(value)}}
+
+
+def _serialize_title(value: object) -> dict:
+    return {"title": [{"text": {"content": "" if value is None else str(value)}}]}
+
+
+def _serialize_rich_text(value: object) -> dict:
+    return {"rich_text": [{"text": {"content": "" if value is None else str(value)}}]}
+
+
+_PROPERTY_SERIALIZERS = {
+    "select": _serialize_select,
+    "date": _serialize_date,
+    "title": _serialize_title,
+    "rich_text": _serialize_rich_text,
+}
 
 
 def _serialize_property(prop_type: str, value: object) -> dict:
-    if prop_type == "select":
-        if value in (None, ""):
-            return {"select": None}
-        return {"select": {"name": str(value)}}
-    if prop_type == "date":
-        if value in (None, ""):
-            return {"date": None}
-        return {"date": {"start": str(value)}}
-    content = "" if value is None else str(value)
-    if prop_type == "title":
-        return {"title": [{"text": {"content": content}}]}
-    if prop_type == "rich_text":
-        return {"rich_text": [{"text": {"content": content}}]}
-    return {"rich_text": [{"text": {"content": content}}]}
+    return _PROPERTY_SERIALIZERS.get(prop_type, _serialize_rich_text)(value)
 
 
 def _get_title_property_name(mapping: dict) -> str:
@@ -254,22 +335,7 @@ def _is_completed_status(fields: dict) -> bool:
 
 
 def _extract_fields(properties: dict) -> dict:
-    fields = {}
-    for name, prop in properties.items():
-        prop_type = prop.get("type")
-        if prop_type == "title":
-            values = prop.get("title", [])
-            fields[name] = " ".join(v.get("plain_text", "") for v in values).strip()
-        elif prop_type == "rich_text":
-            values = prop.get("rich_text", [])
-            fields[name] = " ".join(v.get("plain_text", "") for v in values).strip()
-        elif prop_type == "select":
-            fields[name] = (prop.get("select") or {}).get("name", "")
-        elif prop_type == "date":
-            fields[name] = (prop.get("date") or {}).get("start", "")
-        else:
-            fields[name] = ""
-    return fields
+    return {name: _property_text(prop) for name, prop in properties.items()}
 
 
 def _extract_fields_by_mapping(properties: dict, mapping: dict) -> tuple[dict, list[str]]:
@@ -280,41 +346,54 @@ def _extract_fields_by_mapping(properties: dict, mapping: dict) -> tuple[dict, l
         name = prop.get("name")
         if not name:
             continue
-        prop_data = properties.get(name, {})
-        prop_type = prop_data.get("type")
-        if prop_type == "title":
-            values = prop_data.get("title", [])
-            fields[field_key] = " ".join(v.get("plain_text", "") for v in values).strip()
-        elif prop_type == "rich_text":
-            values = prop_data.get("rich_text", [])
-            fields[field_key] = " ".join(v.get("plain_text", "") for v in values).strip()
-        elif prop_type == "select":
-            fields[field_key] = (prop_data.get("select") or {}).get("name", "")
-        elif prop_type == "date":
-            fields[field_key] = (prop_data.get("date") or {}).get("start", "")
-        else:
-            fields[field_key] = ""
+        fields[field_key] = _property_text(properties.get(name, {}))
     for name, prop_data in properties.items():
         if name in mapped_names:
             continue
-        prop_type = prop_data.get("type")
-        if prop_type == "title":
-            values = prop_data.get("title", [])
-            text = " ".join(v.get("plain_text", "") for v in values).strip()
-        elif prop_type == "rich_text":
-            values = prop_data.get("rich_text", [])
-            text = " ".join(v.get("plain_text", "") for v in values).strip()
-        elif prop_type == "select":
-            text = (prop_data.get("select") or {}).get("name", "")
-        elif prop_type == "date":
-            text = (prop_data.get("date") or {}).get("start", "")
-        else:
-            text = ""
+        text = _property_text(prop_data)
         if text:
             unmapped.append(f"{name}: {text}")
     return fields, unmapped
 
 
+def _property_text(prop: dict) -> str:
+    reader = _PROPERTY_READERS.get(prop.get("type"))
+    return reader(prop) if reader else ""
+
+
+def _read_title(prop: dict) -> str:
+    return _extract_text(prop.get("title", []))
+
+
+def _read_rich_text(prop: dict) -> str:
+    return _extract_text(prop.get("rich_text", []))
+
+
+def _read_select(prop: dict) -> str:
+    return (prop.get("select") or {}).get("name", "")
+
+
+def _read_date(prop: dict) -> str:
+    return (prop.get("date") or {}).get("start", "")
+
+
+_PROPERTY_READERS = {
+    "title": _read_title,
+    "rich_text": _read_rich_text,
+    "select": _read_select,
+    "date": _read_date,
+}
+
+
+def _extract_text(values: list) -> str:
+    # Most titles and notes are a single run; skip the join for those.
+    if not values:
+        return ""
+    if len(values) == 1:
+        return (values[0].get("plain_text") or "").strip()
+    return " ".join(v.get("plain_text", "") for v in values).strip()
+
+
 def _find_notes_key(mapping: dict) -> str | None:
     for key, prop in mapping.items():
         if prop.get("name") == "Notes" and prop.get("type") == "rich_text":
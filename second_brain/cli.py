@@ -1,23 +1,26 @@
 import argparse
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 from second_brain.config import load_config
 from second_brain.core.pipeline import Pipeline, build_digest
 from second_brain.registry import build_adapter
 
+UTC = timezone.utc
+
 
 def _ensure_data_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def _load_adapters(config):
-    capture = build_adapter(config.capture.class_path, config.capture.settings)
-    ai = build_adapter(config.ai.class_path, config.ai.settings)
-    storage = build_adapter(config.storage.class_path, config.storage.settings)
-    notifier = build_adapter(config.notifier.class_path, config.notifier.settings)
-    return capture, ai, storage, notifier
+def _load_adapters(config, *names: str) -> tuple:
+    # Build only the adapters a command uses; constructing one can open clients.
+    adapters = []
+    for name in names or ("capture", "ai", "storage", "notifier"):
+        adapter_config = getattr(config, name)
+        adapters.append(build_adapter(adapter_config.class_path, adapter_config.settings))
+    return tuple(adapters)
 
 
 def _parse_update_fields(set_pairs: list[str], json_payload: str | None) -> dict:
@@ -31,11 +34,9 @@ def _parse_update_fields(set_pairs: list[str], json_payload: str | None) -> dict
             raise SystemExit("--json must be a JSON object.")
         updates.update(payload)
     for pair in set_pairs or []:
-        if "=" not in pair:
-            raise SystemExit(f"Invalid --set value '{pair}'. Use key=value.")
-        key, value = pair.split("=", 1)
+        key, sep, value = pair.partition("=")
         key = key.strip()
-        if not key:
+        if not sep or not key:
             raise SystemExit(f"Invalid --set value '{pair}'. Use key=value.")
         updates[key] = value
     return updates
@@ -63,7 +64,7 @@ def cmd_capture(args) -> None:
     capture = build_adapter(config.capture.class_path, config.capture.settings)
     if not hasattr(capture, "enqueue"):
         raise SystemExit("Capture adapter does not support enqueue().")
-    capture.enqueue(args.text, source="cli", created_at=datetime.utcnow())
+    capture.enqueue(args.text, source="cli", created_at=datetime.now(UTC))
     print("Captured.")
 
 
@@ -85,7 +86,7 @@ def cmd_run(args) -> None:
 def cmd_daily(args) -> None:
     config = load_config(args.config)
     _ensure_data_dir(config.data_dir)
-    _, ai, storage, notifier = _load_adapters(config)
+    ai, storage, notifier = _load_adapters(config, "ai", "storage", "notifier")
     build_digest(
         ai=ai,
         storage=storage,
@@ -94,13 +95,14 @@ def cmd_daily(args) -> None:
         days=1,
         title="Daily Digest",
         weekly=False,
+        limit=args.limit,
     )
 
 
 def cmd_weekly(args) -> None:
     config = load_config(args.config)
     _ensure_data_dir(config.data_dir)
-    _, ai, storage, notifier = _load_adapters(config)
+    ai, storage, notifier = _load_adapters(config, "ai", "storage", "notifier")
     build_digest(
         ai=ai,
         storage=storage,
@@ -109,6 +111,7 @@ def cmd_weekly(args) -> None:
         days=7,
         title="Weekly Review",
         weekly=True,
+        limit=args.limit,
     )
 
 
@@ -139,9 +142,11 @@ def build_parser() -> argparse.ArgumentParser:
     run_cmd.set_defaults(func=cmd_run)
 
     daily_cmd = sub.add_parser("daily", help="Send daily digest")
+    daily_cmd.add_argument("--limit", type=int, help="Only include the N most recent records")
     daily_cmd.set_defaults(func=cmd_daily)
 
     weekly_cmd = sub.add_parser("weekly", help="Send weekly review")
+    weekly_cmd.add_argument("--limit", type=int, help="Only include the N most recent records")
     weekly_cmd.set_defaults(func=cmd_weekly)
 
     update_cmd = sub.add_parser("update", help="Update a record in storage")
@@ -1,6 +1,7 @@
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 
@@ -40,13 +41,17 @@ def load_dotenv(path: str = ".env") -> None:
 
 
 def _resolve_env(value: Any) -> Any:
-    if isinstance(value, str) and value.startswith("$"):
-        env_key = value[1:]
-        return os.environ.get(env_key, value)
+    # Substitutes in place: the config is freshly parsed and owned by load_config.
+    if isinstance(value, str):
+        if value.startswith("$"):
+            return os.environ.get(value[1:], value)
+        return value
     if isinstance(value, dict):
-        return {k: _resolve_env(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_resolve_env(v) for v in value]
+        for key, item in value.items():
+            value[key] = _resolve_env(item)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            value[index] = _resolve_env(item)
     return value
 
 
@@ -57,8 +62,16 @@ def load_config(path: Optional[str] = None) -> AppConfig:
         example_path = "config.example.json"
         if os.path.exists(example_path):
             config_path = example_path
-    with open(config_path, "r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    stat = os.stat(config_path)
+    return _load_config_file(config_path, stat.st_mtime_ns, stat.st_size)
+
+
+# Keyed on mtime and size so edits to the file are picked up. Environment
+# variables are resolved on first load only; they are fixed for a process.
+@lru_cache(maxsize=8)
+def _load_config_file(config_path: str, mtime_ns: int, size: int) -> AppConfig:
+    with open(config_path, "rb") as handle:
+        raw = json.loads(handle.read())
 
     raw = _resolve_env(raw)
 
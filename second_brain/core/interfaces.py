@@ -35,8 +35,14 @@ class StorageAdapter(ABC):
     def log_inbox(self, entry: dict) -> None:
         raise NotImplementedError
 
+    def log_inbox_batch(self, entries: List[dict]) -> None:
+        for entry in entries:
+            self.log_inbox(entry)
+
     @abstractmethod
-    def list_records(self, categories: Iterable[str], days: Optional[int] = None) -> List[StoredRecord]:
+    def list_records(
+        self, categories: Iterable[str], days: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[StoredRecord]:
         raise NotImplementedError
 
     @abstractmethod
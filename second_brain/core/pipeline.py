@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Iterable, List, Optional
 
 from second_brain.core.interfaces import AIProvider, CaptureAdapter, Notifier, StorageAdapter
 from second_brain.core.models import CaptureItem, ClassificationResult, StoredRecord
 
 
-VALID_CATEGORIES = {"people", "projects", "ideas", "admin"}
+UTC = timezone.utc
+VALID_CATEGORIES = frozenset({"people", "projects", "ideas", "admin"})
 PRIORITY_PATTERN = re.compile(r"(?:^|\\s)(--priority|-p)(?:\\s+|=)([1-5])\\b", re.IGNORECASE)
 
 
@@ -20,28 +22,65 @@ class Pipeline:
         storage: StorageAdapter,
         notifier: Notifier,
         confidence_threshold: float,
+        max_workers: int = 8,
     ) -> None:
         self.capture = capture
         self.ai = ai
         self.storage = storage
         self.notifier = notifier
         self.confidence_threshold = confidence_threshold
+        self.max_workers = max_workers
 
     def run(self) -> List[StoredRecord]:
         items = self.capture.fetch()
         stored: List[StoredRecord] = []
-        for item in items:
-            cleaned_text, priority, explicit_priority = _extract_priority(item.text)
-            if priority is None:
-                priority = _infer_priority(cleaned_text)
-            result = self.ai.classify(cleaned_text)
-            stored_record = self._handle_classification(item, result, priority, explicit_priority)
-            if stored_record:
-                stored.append(stored_record)
+        if not items:
+            return stored
+        # Classification is the slow network call and items are independent, so it
+        # runs concurrently; storage and notifications stay sequential and in order.
+        # A single item (the webhook case) is classified inline, without a pool.
+        executor: Optional[ThreadPoolExecutor] = None
+        if len(items) == 1:
+            classified: Iterable[tuple[ClassificationResult, int, bool]] = map(self._classify, items)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(items))))
+            classified = executor.map(self._classify, items)
+        # Inbox log entries are written together once the items are handled.
+        logs: List[dict] = []
+        try:
+            for item, (result, priority, explicit_priority) in zip(items, classified):
+                stored_record = self._handle_classification(item, result, priority, explicit_priority, logs)
+                if stored_record:
+                    stored.append(stored_record)
+        except BaseException:
+            # Still log the items handled before the failure, but never let a
+            # failing flush (often the same outage) replace the original error.
+            try:
+                self.storage.log_inbox_batch(logs)
+            except Exception as flush_error:
+                print("Failed to write inbox log", {"entries": len(logs), "error": repr(flush_error)})
+            raise
+        finally:
+            if executor is not None:
+                # On a failure, stop at it instead of waiting for (and paying for)
+                # the classifications that have not started yet.
+                executor.shutdown(wait=False, cancel_futures=True)
+        self.storage.log_inbox_batch(logs)
         return stored
 
+    def _classify(self, item: CaptureItem) -> tuple[ClassificationResult, int, bool]:
+        cleaned_text, priority, explicit_priority = _extract_priority(item.text)
+        if priority is None:
+            priority = _infer_priority(cleaned_text)
+        return self.ai.classify(cleaned_text), priority, explicit_priority
+
     def _handle_classification(
-        self, item: CaptureItem, result: ClassificationResult, priority: int, explicit_priority: bool
+        self,
+        item: CaptureItem,
+        result: ClassificationResult,
+        priority: int,
+        explicit_priority: bool,
+        logs: List[dict],
     ) -> Optional[StoredRecord]:
         category = result.category
         if category not in VALID_CATEGORIES:
@@ -54,7 +93,8 @@ class Pipeline:
                 raw=result.raw,
             )
 
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
+        timestamp = now.isoformat()
         log_entry = {
             "source_id": item.item_id,
             "source": item.source,
@@ -62,31 +102,34 @@ class Pipeline:
             "category": category,
             "title": result.title,
             "confidence": result.confidence,
-            "timestamp": now.isoformat(),
+            "timestamp": timestamp,
         }
 
         if result.confidence < self.confidence_threshold:
             log_entry["status"] = "needs_review"
-            self.storage.log_inbox(log_entry)
+            logs.append(log_entry)
             self.notifier.notify_needs_review(
                 f"Needs review: '{result.title}' ({category}, {result.confidence:.2f})."
             )
             return None
 
-        record_fields = dict(result.fields)
-        if "name" not in record_fields and "title" not in record_fields:
-            record_fields["name"] = result.title
-        _apply_priority(record_fields, priority, explicit_priority)
+        fields = result.fields
+        updates: dict = {}
+        if "name" not in fields and "title" not in fields:
+            updates["name"] = result.title
+        priority_key = _priority_key(fields, explicit_priority)
+        if priority_key:
+            updates[priority_key] = str(priority)
         if category == "people":
-            record_fields["last_touched"] = now.date().isoformat()
-        if category == "admin":
-            due_date = record_fields.get("due_date", "")
-            if not _is_reasonable_due_date(due_date):
-                record_fields["due_date"] = ""
+            updates["last_touched"] = timestamp[:10]
+        if category == "admin" and not _is_reasonable_due_date(fields.get("due_date", "")):
+            updates["due_date"] = ""
+        # Copy the classifier's fields only when something has to change.
+        record_fields = {**fields, **updates} if updates else fields
         stored_record = self.storage.store(category, record_fields)
         log_entry["status"] = "filed"
         log_entry["record_id"] = stored_record.record_id
-        self.storage.log_inbox(log_entry)
+        logs.append(log_entry)
         self.notifier.notify_filed(
             f"Filed as {category}: {stored_record.title} ({result.confidence:.2f})."
         )
@@ -101,8 +144,9 @@ def build_digest(
     days: int,
     title: str,
     weekly: bool = False,
+    limit: Optional[int] = None,
 ) -> None:
-    records = storage.list_records(categories=categories, days=days)
+    records = storage.list_records(categories=categories, days=days, limit=limit)
     if weekly:
         summary = ai.summarize_weekly(records)
     else:
@@ -117,7 +161,7 @@ def _is_reasonable_due_date(value: str) -> bool:
         due = datetime.fromisoformat(value).date()
     except ValueError:
         return False
-    return due >= datetime.utcnow().date()
+    return due >= datetime.now(UTC).date()
 
 
 def _extract_priority(text: str) -> tuple[str, Optional[int], bool]:
@@ -142,11 +186,10 @@ def _infer_priority(text: str) -> int:
     return 3
 
 
-def _apply_priority(record_fields: dict, priority: int, explicit_priority: bool) -> None:
+def _priority_key(record_fields: dict, explicit_priority: bool) -> Optional[str]:
+    """Field to write the priority into, or None to keep the classifier's value."""
     if explicit_priority:
-        key = "Priority" if "Priority" in record_fields and "priority" not in record_fields else "priority"
-        record_fields[key] = str(priority)
-        return
+        return "Priority" if "Priority" in record_fields and "priority" not in record_fields else "priority"
     if "priority" in record_fields or "Priority" in record_fields:
-        return
-    record_fields["priority"] = str(priority)
+        return None
+    return "priority"
@@ -1,159 +1,265 @@
 from __future__ import annotations
 
 import base64
+import heapq
 import hmac
 import json
 import os
 import re
-import urllib.request
+import threading
+import time
 from datetime import datetime, timezone
-from hashlib import sha1
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from second_brain.config import load_config
+from second_brain.adapters import _http
+from second_brain.adapters._files import atomic_write
+from second_brain.config import AppConfig, load_config
 from second_brain.core.pipeline import Pipeline, build_digest
 from second_brain.core.models import StoredRecord
 from second_brain.registry import build_adapter
 
+try:  # Optional; the handler falls back to the stdlib json module.
+    import orjson
+except ImportError:
+    orjson = None
 
-PROCESSED_IDS_PATH = "/tmp/webex_processed.json"
+
+UTC = timezone.utc
+PROCESSED_IDS_PATH = "/tmp/webex_processed.txt"
+PROCESSED_IDS_LIMIT = 10000
 STATE_PATH = "/tmp/webex_state.json"
 VALID_CATEGORIES = {"people", "projects", "ideas", "admin"}
 CATEGORIES = ["projects", "people", "ideas", "admin"]
 LIST_LIMIT = 20
 STATE_TTL_MINUTES = 30
 COMPLETED_STATUSES = {"done", "completed", "complete", "closed", "archived"}
+# Sort rank for open-record digests; unknown statuses rank 3.
+STATUS_RANK = {
+    **dict.fromkeys(("blocked", "in progress", "active"), 0),
+    **dict.fromkeys(("open", "doing", "next", "todo"), 1),
+    **dict.fromkeys(("backlog", "someday", "later"), 2),
+    **dict.fromkeys(COMPLETED_STATUSES, 9),
+}
+# Messages the bot itself posts; matched case-sensitively so user text like
+# "filed as ..." is still captured.
+SYSTEM_PREFIXES = ("[SB DIGEST]", "Filed as", "Needs review", "Daily Digest", "Weekly Review")
+BOT_PREFIXES = ("task_master", "taskmanager", "task manager", "bot")
+# Fields shown next to a record in digests, in order of preference.
+CONTEXT_KEYS = {
+    "projects": ("Next Action", "next_action", "Notes", "notes"),
+    "people": ("Context", "context", "Follow Ups", "follow_ups"),
+    "ideas": ("One Liner", "one_liner", "Notes", "notes"),
+}
+DEFAULT_CONTEXT_KEYS = ("Notes", "notes")
+FIX_CATEGORIES = {
+    "person": "people",
+    "people": "people",
+    "project": "projects",
+    "projects": "projects",
+    "idea": "ideas",
+    "ideas": "ideas",
+    "admin": "admin",
+}
+# Commands by their whitespace-normalized text, after "?" and "!" are removed.
+COMMANDS = {
+    "help": "help",
+    "commands": "help",
+    "next": "next",
+    "today": "today",
+    "daily": "today",
+    "week": "week",
+    "weekly": "week",
+    "this week": "week",
+}
+COMMAND_PUNCTUATION = str.maketrans("", "", "?!")
+UPDATE_NUMBER_PATTERN = re.compile(r"(\d+)\b")
+FIELD_SELECTION_PATTERN = re.compile(r"(\d+)(?:[\).:\-]\s*|\s+)?(.*)$")
+MESSAGE_CACHE_SIZE = 256
+MESSAGE_CACHE_TTL_SECONDS = 300
+# The Lambda environment is fixed for the container's lifetime, so read it once.
+BOT_TOKEN = os.environ.get("WEBEX_BOT_TOKEN")
+WEBHOOK_SECRET = os.environ.get("WEBEX_WEBHOOK_SECRET")
+BOT_EMAIL = os.environ.get("WEBEX_BOT_EMAIL")
+BOT_ID = os.environ.get("WEBEX_BOT_ID")
+BOT_NAME = os.environ.get("WEBEX_BOT_NAME", "").strip().lower()
+DIGEST_ROOM_ID = os.environ.get("WEBEX_DIGEST_ROOM_ID", "")
+FUNCTION_NAME = os.environ.get("AWS_LAMBDA_FUNCTION_NAME", "")
+RUN_PIPELINE = os.environ.get("SB_RUN_PIPELINE", "true").lower() == "true"
+ASYNC_CAPTURE = (
+    os.environ.get("SB_ASYNC_PIPELINE", "false").lower() == "true" and RUN_PIPELINE and bool(FUNCTION_NAME)
+)
+EXTRACTIVE_DIGESTS = os.environ.get("SB_EXTRACTIVE_DIGESTS", "true").lower() == "true"
+MEMORY_ONLY_STATE = os.environ.get("SB_STATE_BACKEND", "file").lower() == "memory"
+# The configured bot name is tried first, then the built-in aliases; each may
+# be @-mentioned and must be followed by a space or colon.
+BOT_PREFIX_PATTERN = re.compile(
+    r"@?(?:" + "|".join(re.escape(name) for name in ((BOT_NAME,) if BOT_NAME else ()) + BOT_PREFIXES) + r")[ :]",
+    re.IGNORECASE,
+)
+
+# Adapters survive across warm invocations, keyed by (adapter, room_id).
+_ADAPTERS: Dict[Tuple[str, Optional[str]], Any] = {}
+_LAMBDA_CLIENT: Any = None
+_CONFIG: Optional[AppConfig] = None
+# Serializes config loading and adapter construction between the request
+# thread and the cold-start prewarm thread; reentrant because building an
+# adapter loads the config.
+_INIT_LOCK = threading.RLock()
+_PREWARM: Optional[threading.Thread] = None
+# /tmp is private to the container, so the in-memory copies are authoritative
+# after the first read; the files only survive for the container's lifetime.
+_STATE_CACHE: Optional[dict] = None
+_PROCESSED_CACHE: Optional[Dict[str, None]] = None
+# Fetched Webex messages by id, so fix replies to the same parent skip the GET.
+# Least recently used entries are evicted first; the TTL bounds staleness after edits.
+_MESSAGE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# Event key used when the function invokes itself to capture a message asynchronously.
+ASYNC_CAPTURE_KEY = "sb_capture"
 
 
 def _verify_signature(secret: str, body: bytes, signature: str) -> bool:
-    expected = hmac.new(secret.encode("utf-8"), body, sha1).hexdigest()
-    return hmac.compare_digest(expected, signature)
-
-
-def _get_header(headers: Dict[str, str], name: str) -> str:
-    for key, value in headers.items():
-        if key.lower() == name.lower():
-            return value
-    return ""
+    # One-shot OpenSSL HMAC; compare the raw 20 bytes rather than hex strings.
+    expected = hmac.digest(secret.encode("utf-8"), body, "sha1")
+    try:
+        received = bytes.fromhex(signature)
+    except ValueError:
+        return False
+    return len(received) == len(expected) and hmac.compare_digest(expected, received)
 
 
 def _webex_get_message(message_id: str, token: str) -> Dict[str, Any]:
+    now = time.monotonic()
+    cached = _MESSAGE_CACHE.pop(message_id, None)
+    if cached is not None and cached[0] > now:
+        _MESSAGE_CACHE[message_id] = cached
+        return cached[1]
     url = f"https://webexapis.com/v1/messages/{message_id}"
-    request = urllib.request.Request(url, method="GET")
-    request.add_header("Authorization", f"Bearer {token}")
-    with urllib.request.urlopen(request, timeout=8) as response:
-        return json.loads(response.read().decode("utf-8"))
+    message = _json_loads(_http.request("GET", url, headers={"Authorization": f"Bearer {token}"}, timeout=8))
+    if len(_MESSAGE_CACHE) >= MESSAGE_CACHE_SIZE:
+        _MESSAGE_CACHE.pop(next(iter(_MESSAGE_CACHE)))
+    _MESSAGE_CACHE[message_id] = (now + MESSAGE_CACHE_TTL_SECONDS, message)
+    return message
 
 
 def _webex_post_message(room_id: str, token: str, text: str) -> None:
     url = "https://webexapis.com/v1/messages"
-    payload = json.dumps({"roomId": room_id, "text": text}).encode("utf-8")
-    request = urllib.request.Request(url, data=payload, method="POST")
-    request.add_header("Authorization", f"Bearer {token}")
-    request.add_header("Content-Type", "application/json")
-    with urllib.request.urlopen(request, timeout=8) as response:
-        response.read()
+    payload = _json_bytes({"roomId": room_id, "text": text})
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    _http.request("POST", url, body=payload, headers=headers, timeout=8)
+
+
+def _load_processed_ids() -> Dict[str, None]:
+    """Processed message ids, oldest first (a dict used as an ordered set)."""
+    global _PROCESSED_CACHE
+    if _PROCESSED_CACHE is not None:
+        return _PROCESSED_CACHE
+    lines: list[str] = []
+    if os.path.exists(PROCESSED_IDS_PATH):
+        try:
+            with open(PROCESSED_IDS_PATH, "r", encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+        except OSError:
+            lines = []
+    ids = dict.fromkeys(line for line in lines[-PROCESSED_IDS_LIMIT:] if line)
+    _PROCESSED_CACHE = ids
+    # The file is append-only; compact it once it holds well over the limit.
+    if len(lines) > 2 * PROCESSED_IDS_LIMIT and not MEMORY_ONLY_STATE:
+        atomic_write(PROCESSED_IDS_PATH, "".join(f"{message_id}\n" for message_id in ids).encode("utf-8"))
+    return ids
+
+
+def _remember_processed_id(message_id: str) -> None:
+    ids = _load_processed_ids()
+    ids[message_id] = None
+    if len(ids) > PROCESSED_IDS_LIMIT:
+        del ids[next(iter(ids))]
+    if MEMORY_ONLY_STATE:
+        return
+    with open(PROCESSED_IDS_PATH, "a", encoding="utf-8") as handle:
+        handle.write(f"{message_id}\n")
 
 
-def _load_processed_ids() -> set[str]:
-    if not os.path.exists(PROCESSED_IDS_PATH):
-        return set()
-    try:
-        with open(PROCESSED_IDS_PATH, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return set(data)
-    except (json.JSONDecodeError, OSError):
-        return set()
+def _load_state() -> dict:
+    global _STATE_CACHE
+    if _STATE_CACHE is not None:
+        return _STATE_CACHE
+    state: dict = {}
+    if os.path.exists(STATE_PATH):
+        try:
+            with open(STATE_PATH, "rb") as handle:
+                state = _json_loads(handle.read())
+        except (json.JSONDecodeError, OSError):
+            state = {}
+    _STATE_CACHE = state
+    return state
 
 
-def _save_processed_ids(ids: set[str]) -> None:
-    with open(PROCESSED_IDS_PATH, "w", encoding="utf-8") as handle:
-        json.dump(sorted(ids), handle)
+def _save_state(state: dict) -> None:
+    global _STATE_CACHE
+    _STATE_CACHE = state
+    if MEMORY_ONLY_STATE:
+        return
+    atomic_write(STATE_PATH, _json_bytes(state))
 
 
-def _load_state() -> dict:
-    if not os.path.exists(STATE_PATH):
-        return {}
-    try:
-        with open(STATE_PATH, "r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except (json.JSONDecodeError, OSError):
-        return {}
+def _json_bytes(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
-def _save_state(state: dict) -> None:
-    with open(STATE_PATH, "w", encoding="utf-8") as handle:
-        json.dump(state, handle)
+def _json_loads(data: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def _prune_state(state: dict) -> dict:
-    cutoff = datetime.now(timezone.utc).timestamp() - (STATE_TTL_MINUTES * 60)
-    for room_id, room_state in list(state.items()):
-        for person_id, data in list(room_state.items()):
-            updated_at = data.get("updated_at", 0)
-            if updated_at and updated_at < cutoff:
-                room_state.pop(person_id, None)
-        if not room_state:
-            state.pop(room_id, None)
-    return state
+    # Entries without an updated_at never expire, as before.
+    cutoff = time.time() - (STATE_TTL_MINUTES * 60)
+    pruned = {}
+    for room_id, room_state in state.items():
+        live = {
+            person_id: data
+            for person_id, data in room_state.items()
+            if not data.get("updated_at") or data["updated_at"] >= cutoff
+        }
+        if live:
+            pruned[room_id] = live
+    return pruned
 
 
 def _parse_fix_category(text: str) -> str | None:
-    if not text.lower().startswith("fix:"):
+    if text[:4].lower() != "fix:":
         return None
-    remainder = text.split(":", 1)[1].strip().lower()
-    if not remainder:
+    # Only the first word after "fix:" matters; don't lowercase or split the rest.
+    tokens = text[4:].split(None, 1)
+    if not tokens:
         return None
-    token = remainder.split()[0]
-    mapping = {
-        "person": "people",
-        "people": "people",
-        "project": "projects",
-        "projects": "projects",
-        "idea": "ideas",
-        "ideas": "ideas",
-        "admin": "admin",
-    }
-    return mapping.get(token)
+    return FIX_CATEGORIES.get(tokens[0].lower())
 
 
-def _parse_command(text: str) -> str | None:
-    cleaned = _strip_bot_prefix(text).strip().lower()
-    if not cleaned:
-        return None
-    cleaned = cleaned.replace("?", "").replace("!", "").strip()
-    tokens = [t for t in cleaned.split() if t]
-    if not tokens:
-        return None
-    if tokens == ["help"] or tokens == ["commands"]:
-        return "help"
-    if tokens == ["this", "week"]:
-        return "week"
-    if tokens == ["next"]:
-        return "next"
-    if tokens == ["today"] or tokens == ["daily"]:
-        return "today"
-    if tokens == ["week"] or tokens == ["weekly"]:
-        return "week"
-    return None
-
-
-def _parse_update_request(text: str) -> int | None:
-    cleaned = _strip_bot_prefix(text).strip().lower()
+# The command/update/field parsers take the message after _strip_bot_prefix and
+# strip(); command and update parsing also expect it lowercased.
+def _parse_command(cleaned: str) -> str | None:
+    return COMMANDS.get(" ".join(cleaned.translate(COMMAND_PUNCTUATION).split()))
+
+
+def _parse_update_request(cleaned: str) -> int | None:
     if not cleaned.startswith("update"):
         return None
     remainder = cleaned[len("update") :].strip()
     if remainder.startswith(":"):
         remainder = remainder[1:].strip()
-    match = re.match(r"^(\d+)\b", remainder)
+    match = UPDATE_NUMBER_PATTERN.match(remainder)
     if not match:
         return None
     return int(match.group(1))
 
 
-def _parse_field_selection(text: str) -> tuple[int | None, str | None]:
-    cleaned = _strip_bot_prefix(text).strip()
-    match = re.match(r"^(\d+)(?:[\).:\-]\s*|\s+)?(.*)$", cleaned)
+def _parse_field_selection(cleaned: str) -> tuple[int | None, str | None]:
+    match = FIELD_SELECTION_PATTERN.match(cleaned)
     if not match:
         return None, None
     number = int(match.group(1))
@@ -165,86 +271,128 @@ def _strip_bot_prefix(text: str) -> str:
     cleaned = text.strip()
     if not cleaned:
         return cleaned
-    bot_name = os.environ.get("WEBEX_BOT_NAME", "").strip().lower()
-    lower = cleaned.lower()
-    if bot_name:
-        for prefix in (bot_name, f"@{bot_name}"):
-            if lower.startswith(prefix + " "):
-                return cleaned[len(prefix) + 1 :]
-            if lower.startswith(prefix + ":"):
-                return cleaned[len(prefix) + 1 :]
-    for prefix in ("task_master", "taskmanager", "task manager", "bot"):
-        for variant in (prefix, f"@{prefix}"):
-            if lower.startswith(variant + " "):
-                return cleaned[len(variant) + 1 :]
-            if lower.startswith(variant + ":"):
-                return cleaned[len(variant) + 1 :]
-    return cleaned
+    match = BOT_PREFIX_PATTERN.match(cleaned)
+    return cleaned[match.end() :] if match else cleaned
+
+
+def _config() -> AppConfig:
+    # The deployed config cannot change inside a container, so skip even the
+    # mtime check and .env probe that load_config does on each call.
+    global _CONFIG
+    if _CONFIG is None:
+        with _INIT_LOCK:
+            if _CONFIG is None:
+                _CONFIG = load_config()
+    return _CONFIG
+
+
+def _get_adapter(name: str, room_id: Optional[str] = None) -> Any:
+    key = (name, room_id)
+    adapter = _ADAPTERS.get(key)
+    if adapter is not None:
+        return adapter
+    with _INIT_LOCK:
+        # The prewarm thread may have built it while this thread waited.
+        adapter = _ADAPTERS.get(key)
+        if adapter is not None:
+            return adapter
+        adapter_config = getattr(_config(), name)
+        settings = adapter_config.settings
+        if name == "notifier":
+            settings = _notifier_settings(adapter_config.class_path, settings, room_id)
+        adapter = build_adapter(adapter_config.class_path, settings)
+        _ADAPTERS[key] = adapter
+    return adapter
+
+
+def _notifier_settings(class_path: str, settings: dict, room_id: Optional[str]) -> dict:
+    settings = dict(settings)
+    if class_path.endswith("notifier_webex.WebexNotifier"):
+        if room_id:
+            settings["room_id"] = room_id
+        if not settings.get("token") and BOT_TOKEN:
+            settings["token"] = BOT_TOKEN
+    return settings
 
 
 def _enqueue_text(text: str) -> None:
-    config = load_config()
-    capture = build_adapter(config.capture.class_path, config.capture.settings)
+    capture = _get_adapter("capture")
     if not hasattr(capture, "enqueue"):
         raise RuntimeError("Capture adapter does not support enqueue().")
-    capture.enqueue(text, source="webex", created_at=datetime.utcnow())
+    capture.enqueue(text, source="webex", created_at=datetime.now(UTC))
+
+
+def _start_prewarm() -> None:
+    global _PREWARM
+    if _PREWARM is not None or _ADAPTERS or ASYNC_CAPTURE or not RUN_PIPELINE:
+        return
+    # A daemon thread, so it never holds up shutdown; the request thread needs
+    # no join, since _get_adapter blocks on _INIT_LOCK for whatever is in flight.
+    _PREWARM = threading.Thread(target=_prewarm_adapters, daemon=True)
+    _PREWARM.start()
+
+
+def _prewarm_adapters() -> None:
+    # The notifier depends on the room, which only the GET returns; it is
+    # built lazily on first use.
+    try:
+        for name in ("capture", "ai", "storage"):
+            _get_adapter(name)
+    except Exception:
+        pass  # _get_adapter raises the same error again on the request thread.
+
+
+def _capture_text(text: str, room_id: str) -> int:
+    _enqueue_text(text)
+    if RUN_PIPELINE:
+        return _run_pipeline(room_id=room_id)
+    return 0
+
+
+def _dispatch_capture(text: str, room_id: str) -> bool:
+    """Hand the capture to an async invocation of this function, if enabled.
+
+    The event carries the text rather than relying on the queue, since the
+    async invocation may land on a container with a different /tmp.
+    """
+    if not ASYNC_CAPTURE:
+        return False
+    payload = _json_bytes({ASYNC_CAPTURE_KEY: {"text": text, "room_id": room_id}})
+    _lambda_client().invoke(FunctionName=FUNCTION_NAME, InvocationType="Event", Payload=payload)
+    return True
+
+
+def _lambda_client() -> Any:
+    global _LAMBDA_CLIENT
+    if _LAMBDA_CLIENT is None:
+        import boto3  # Provided by the Lambda runtime; only needed for async capture.
+
+        _LAMBDA_CLIENT = boto3.client("lambda")
+    return _LAMBDA_CLIENT
 
 
 def _run_pipeline(room_id: Optional[str] = None) -> int:
-    config = load_config()
-    capture = build_adapter(config.capture.class_path, config.capture.settings)
-    ai = build_adapter(config.ai.class_path, config.ai.settings)
-    storage = build_adapter(config.storage.class_path, config.storage.settings)
-    notifier_settings = dict(config.notifier.settings)
-    if config.notifier.class_path.endswith("notifier_webex.WebexNotifier"):
-        if room_id:
-            notifier_settings["room_id"] = room_id
-        if not notifier_settings.get("token"):
-            token = os.environ.get("WEBEX_BOT_TOKEN")
-            if token:
-                notifier_settings["token"] = token
-    notifier = build_adapter(config.notifier.class_path, notifier_settings)
     pipeline = Pipeline(
-        capture=capture,
-        ai=ai,
-        storage=storage,
-        notifier=notifier,
-        confidence_threshold=config.confidence_threshold,
+        capture=_get_adapter("capture"),
+        ai=_get_adapter("ai"),
+        storage=_get_adapter("storage"),
+        notifier=_get_adapter("notifier", room_id),
+        confidence_threshold=_config().confidence_threshold,
     )
     stored = pipeline.run()
     return len(stored)
 
 
 def _run_digest(digest_type: str, room_id: str, days: int, title: str, weekly: bool) -> None:
-    config = load_config()
-    storage = build_adapter(config.storage.class_path, config.storage.settings)
-    notifier_settings = dict(config.notifier.settings)
-    if config.notifier.class_path.endswith("notifier_webex.WebexNotifier"):
-        notifier_settings["room_id"] = room_id
-        if not notifier_settings.get("token"):
-            token = os.environ.get("WEBEX_BOT_TOKEN")
-            if token:
-                notifier_settings["token"] = token
-    notifier = build_adapter(config.notifier.class_path, notifier_settings)
-    if os.environ.get("SB_EXTRACTIVE_DIGESTS", "true").lower() == "true":
-        if days == 1:
-            records = _select_daily_records(storage, days=days)
-        else:
-            records = storage.list_records(categories=CATEGORIES, days=days)
-            records.sort(key=lambda r: (_priority_value(r), r.created_at))
-        lines = []
-        for record in records[:LIST_LIMIT]:
-            context = _record_context(record)
-            if context:
-                lines.append(f"- {record.category}: {record.title} — {context}")
-            else:
-                lines.append(f"- {record.category}: {record.title}")
+    storage = _get_adapter("storage")
+    notifier = _get_adapter("notifier", room_id)
+    if EXTRACTIVE_DIGESTS:
+        lines = [f"- {_record_line(record)}" for record in _select_digest_records(storage, days)]
         body = "\n".join(lines) if lines else "No items found."
         notifier.notify_digest(f"{title}\n{body}")
         return
-    ai = build_adapter(config.ai.class_path, config.ai.settings)
     build_digest(
-        ai=ai,
+        ai=_get_adapter("ai"),
         storage=storage,
         notifier=notifier,
         categories=CATEGORIES,
@@ -254,27 +402,20 @@ def _run_digest(digest_type: str, room_id: str, days: int, title: str, weekly: b
     )
 
 
+def _record_line(record: StoredRecord) -> str:
+    context = _record_context(record)
+    if context:
+        return f"{record.category}: {record.title} — {context}"
+    return f"{record.category}: {record.title}"
+
+
 def _record_context(record: StoredRecord) -> str:
     fields = record.fields or {}
-    if record.category == "projects":
-        return (
-            fields.get("Next Action")
-            or fields.get("next_action")
-            or fields.get("Notes")
-            or fields.get("notes")
-            or ""
-        )
-    if record.category == "people":
-        return (
-            fields.get("Context")
-            or fields.get("context")
-            or fields.get("Follow Ups")
-            or fields.get("follow_ups")
-            or ""
-        )
-    if record.category == "ideas":
-        return fields.get("One Liner") or fields.get("one_liner") or fields.get("Notes") or fields.get("notes") or ""
-    return fields.get("Notes") or fields.get("notes") or ""
+    for key in CONTEXT_KEYS.get(record.category, DEFAULT_CONTEXT_KEYS):
+        value = fields.get(key)
+        if value:
+            return value
+    return ""
 
 
 def _status_value(record: StoredRecord) -> str:
@@ -296,15 +437,7 @@ def _priority_value(record: StoredRecord) -> int:
 
 
 def _status_priority(status: str) -> int:
-    if status in {"blocked", "in progress", "active"}:
-        return 0
-    if status in {"open", "doing", "next", "todo"}:
-        return 1
-    if status in {"backlog", "someday", "later"}:
-        return 2
-    if status in COMPLETED_STATUSES:
-        return 9
-    return 3
+    return STATUS_RANK.get(status, 3)
 
 
 def _filter_open_records(records: list[StoredRecord]) -> list[StoredRecord]:
@@ -317,35 +450,36 @@ def _filter_open_records(records: list[StoredRecord]) -> list[StoredRecord]:
     return filtered
 
 
+def _select_digest_records(storage, days: int) -> list[StoredRecord]:
+    if days == 1:
+        return _select_daily_records(storage, days=days)
+    records = storage.list_records(categories=CATEGORIES, days=days)
+    return heapq.nsmallest(LIST_LIMIT, records, key=_record_rank)
+
+
 def _select_daily_records(storage, days: int) -> list[StoredRecord]:
+    # Only LIST_LIMIT records are shown, so select them instead of sorting everything.
     recent = storage.list_records(categories=CATEGORIES, days=days)
     if recent:
-        recent.sort(key=lambda r: (_priority_value(r), r.created_at))
-        return recent
+        return heapq.nsmallest(LIST_LIMIT, recent, key=_record_rank)
     all_records = storage.list_records(categories=CATEGORIES, days=None)
-    open_records = _filter_open_records(all_records)
-    open_records.sort(
-        key=lambda r: (_priority_value(r), _status_priority(_status_value(r)), r.created_at)
-    )
-    return open_records[:LIST_LIMIT]
+    return heapq.nsmallest(LIST_LIMIT, _filter_open_records(all_records), key=_open_record_rank)
 
 
-def _send_digest_list(room_id: str, person_id: str, days: int, title: str) -> None:
-    config = load_config()
-    storage = build_adapter(config.storage.class_path, config.storage.settings)
-    if days == 1:
-        records = _select_daily_records(storage, days=days)
-    else:
-        records = storage.list_records(categories=CATEGORIES, days=days)
-        records.sort(key=lambda r: (_priority_value(r), r.created_at))
+def _record_rank(record: StoredRecord) -> tuple:
+    return _priority_value(record), record.created_at
+
+
+def _open_record_rank(record: StoredRecord) -> tuple:
+    return _priority_value(record), _status_priority(_status_value(record)), record.created_at
+
+
+def _send_digest_list(state: dict, room_id: str, person_id: str, days: int, title: str) -> None:
+    storage = _get_adapter("storage")
     lines = [title]
     items = []
-    for idx, record in enumerate(records[:LIST_LIMIT], start=1):
-        context = _record_context(record)
-        line = f"{idx}) {record.category}: {record.title}"
-        if context:
-            line += f" — {context}"
-        lines.append(line)
+    for idx, record in enumerate(_select_digest_records(storage, days), start=1):
+        lines.append(f"{idx}) {_record_line(record)}")
         items.append(
             {
                 "record_id": record.record_id,
@@ -357,14 +491,11 @@ def _send_digest_list(room_id: str, person_id: str, days: int, title: str) -> No
     if not items:
         lines.append("No items found.")
     message = "\n".join(lines)
-    token = os.environ.get("WEBEX_BOT_TOKEN")
-    if token:
-        _webex_post_message(room_id, token, message)
-    state = _load_state()
-    state = _prune_state(state)
+    if BOT_TOKEN:
+        _webex_post_message(room_id, BOT_TOKEN, message)
     room_state = state.setdefault(room_id, {})
     room_state[person_id] = {
-        "updated_at": datetime.now(timezone.utc).timestamp(),
+        "updated_at": time.time(),
         "last_list": items,
         "pending_update": None,
     }
@@ -382,9 +513,13 @@ def _build_field_options(record: dict, property_map: dict | None) -> list[dict]:
 
 
 def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
+    async_capture = event.get(ASYNC_CAPTURE_KEY)
+    if async_capture:
+        processed = _capture_text(async_capture["text"], async_capture.get("room_id", ""))
+        return {"statusCode": 200, "body": json.dumps({"status": "processed", "processed": processed})}
     digest_type = event.get("digest") or event.get("detail", {}).get("digest")
     if digest_type in {"daily", "weekly"}:
-        room_id = os.environ.get("WEBEX_DIGEST_ROOM_ID", "")
+        room_id = DIGEST_ROOM_ID
         if not room_id:
             return {"statusCode": 500, "body": "missing WEBEX_DIGEST_ROOM_ID"}
         if digest_type == "weekly":
@@ -400,22 +535,25 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
         body_bytes = base64.b64decode(body)
     else:
         body_bytes = body.encode("utf-8")
+    if not body_bytes:
+        return {"statusCode": 200, "body": "ignored"}
 
-    headers = event.get("headers", {}) or {}
-    secret = os.environ.get("WEBEX_WEBHOOK_SECRET")
-    if secret:
-        signature = _get_header(headers, "X-Spark-Signature")
-        if not signature or not _verify_signature(secret, body_bytes, signature):
+    # Header names are case-insensitive and API Gateway passes them through as sent.
+    headers = {key.lower(): value for key, value in (event.get("headers") or {}).items()}
+    if WEBHOOK_SECRET:
+        signature = headers.get("x-spark-signature", "")
+        if not signature or not _verify_signature(WEBHOOK_SECRET, body_bytes, signature):
             print("Invalid webhook signature")
             return {"statusCode": 401, "body": "invalid signature"}
 
-    payload = json.loads(body_bytes.decode("utf-8"))
+    # Only parse once the signature has been checked against the raw bytes.
+    payload = _json_loads(body_bytes)
     data = payload.get("data", {})
     if payload.get("resource") != "messages" or payload.get("event") != "created":
         print(f"Ignoring event: resource={payload.get('resource')} event={payload.get('event')}")
         return {"statusCode": 200, "body": "ignored"}
 
-    token = os.environ.get("WEBEX_BOT_TOKEN")
+    token = BOT_TOKEN
     if not token:
         print("Missing WEBEX_BOT_TOKEN")
         return {"statusCode": 500, "body": "missing WEBEX_BOT_TOKEN"}
@@ -424,15 +562,19 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
     if not message_id:
         print("Missing message id")
         return {"statusCode": 200, "body": "missing message id"}
+    # Webex redelivers webhooks it thinks failed; skip captures already handled
+    # before spending a GET on them.
+    if message_id in _load_processed_ids():
+        return {"statusCode": 200, "body": "duplicate"}
 
+    # On a cold container, build the pipeline adapters while the GET is in flight.
+    _start_prewarm()
     message = _webex_get_message(message_id, token)
-    bot_email = os.environ.get("WEBEX_BOT_EMAIL")
-    bot_id = os.environ.get("WEBEX_BOT_ID")
     if message.get("personType") == "bot":
         return {"statusCode": 200, "body": "ignored bot"}
-    if bot_email and message.get("personEmail") == bot_email:
+    if BOT_EMAIL and message.get("personEmail") == BOT_EMAIL:
         return {"statusCode": 200, "body": "ignored bot"}
-    if bot_id and message.get("personId") == bot_id:
+    if BOT_ID and message.get("personId") == BOT_ID:
         return {"statusCode": 200, "body": "ignored bot"}
     if message.get("personEmail", "").endswith("@webex.bot"):
         return {"statusCode": 200, "body": "ignored bot"}
@@ -443,24 +585,26 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
     text = (message.get("text") or "").strip()
     if not text:
         return {"statusCode": 200, "body": "empty message"}
-    if text.startswith(("[SB DIGEST]", "Filed as", "Needs review", "Daily Digest", "Weekly Review")):
+    if text.startswith(SYSTEM_PREFIXES):
         return {"statusCode": 200, "body": "ignored system message"}
 
-    if _strip_bot_prefix(text).strip().lower() in {"cancel", "update cancel"}:
-        state = _load_state()
-        room_state = state.get(room_id, {})
-        person_id = message.get("personId", "")
-        if person_id in room_state:
-            room_state[person_id]["pending_update"] = None
-            room_state[person_id]["updated_at"] = datetime.now(timezone.utc).timestamp()
+    # Conversation state is read once here and saved by whichever branch changes it.
+    state = _prune_state(_load_state())
+    room_state = state.get(room_id, {})
+    person_id = message.get("personId", "")
+    person_state = room_state.get(person_id, {})
+
+    cleaned = _strip_bot_prefix(text).strip()
+    lowered = cleaned.lower()
+
+    if lowered in {"cancel", "update cancel"}:
+        if person_state:
+            person_state["pending_update"] = None
+            person_state["updated_at"] = time.time()
             _save_state(state)
         _webex_post_message(room_id, token, "Update canceled.")
         return {"statusCode": 200, "body": "update canceled"}
 
-    state = _load_state()
-    state = _prune_state(state)
-    room_state = state.get(room_id, {})
-    person_state = room_state.get(message.get("personId", ""), {})
     pending = person_state.get("pending_update")
     if pending and pending.get("awaiting_value"):
         field_key = pending.get("field_key")
@@ -468,19 +612,18 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
         if field_key:
             record_id = pending["record_id"]
             category = pending["category"]
-            config = load_config()
-            storage = build_adapter(config.storage.class_path, config.storage.settings)
+            storage = _get_adapter("storage")
             record = storage.update_record(category, record_id, {field_key: text})
             person_state["pending_update"] = None
-            person_state["updated_at"] = datetime.now(timezone.utc).timestamp()
-            room_state[message.get("personId", "")] = person_state
+            person_state["updated_at"] = time.time()
+            room_state[person_id] = person_state
             state[room_id] = room_state
             _save_state(state)
             _webex_post_message(room_id, token, f"Updated {record.title} — {field_name} set to '{text}'.")
             return {"statusCode": 200, "body": "updated"}
 
     if pending:
-        selection, value = _parse_field_selection(text)
+        selection, value = _parse_field_selection(cleaned)
         if selection is None:
             _webex_post_message(room_id, token, "Reply with a field number (e.g., `2`) or `2 New Value`.")
             return {"statusCode": 200, "body": "awaiting field selection"}
@@ -493,8 +636,8 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
             person_state["pending_update"]["field_key"] = field["key"]
             person_state["pending_update"]["field_name"] = field["name"]
             person_state["pending_update"]["awaiting_value"] = True
-            person_state["updated_at"] = datetime.now(timezone.utc).timestamp()
-            room_state[message.get("personId", "")] = person_state
+            person_state["updated_at"] = time.time()
+            room_state[person_id] = person_state
             state[room_id] = room_state
             _save_state(state)
             _webex_post_message(room_id, token, f"Send the new value for {field['name']}.")
@@ -502,18 +645,17 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
         record_id = pending["record_id"]
         category = pending["category"]
         update_key = field["key"]
-        config = load_config()
-        storage = build_adapter(config.storage.class_path, config.storage.settings)
+        storage = _get_adapter("storage")
         record = storage.update_record(category, record_id, {update_key: value})
         person_state["pending_update"] = None
-        person_state["updated_at"] = datetime.now(timezone.utc).timestamp()
-        room_state[message.get("personId", "")] = person_state
+        person_state["updated_at"] = time.time()
+        room_state[person_id] = person_state
         state[room_id] = room_state
         _save_state(state)
         _webex_post_message(room_id, token, f"Updated {record.title} — {field['name']} set to '{value}'.")
         return {"statusCode": 200, "body": "updated"}
 
-    update_request = _parse_update_request(text)
+    update_request = _parse_update_request(lowered)
     if update_request is not None:
         last_list = person_state.get("last_list", [])
         if not last_list:
@@ -523,7 +665,7 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
             _webex_post_message(room_id, token, "That number is out of range. Try again.")
             return {"statusCode": 200, "body": "update selection out of range"}
         selected = last_list[update_request - 1]
-        config = load_config()
+        config = _config()
         property_map = config.storage.settings.get("property_map", {}).get(selected["category"])
         options = _build_field_options(selected, property_map)
         lines = [f"Choose a field to update for {selected['title']}:"]
@@ -533,8 +675,8 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
                 lines.append(f"{idx}) {option['name']}: {current}")
             else:
                 lines.append(f"{idx}) {option['name']}")
-        room_state[message.get("personId", "")] = {
-            "updated_at": datetime.now(timezone.utc).timestamp(),
+        room_state[person_id] = {
+            "updated_at": time.time(),
             "last_list": last_list,
             "pending_update": {
                 "record_id": selected["record_id"],
@@ -548,7 +690,7 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
         _webex_post_message(room_id, token, "\n".join(lines))
         return {"statusCode": 200, "body": "update prompt sent"}
 
-    command = _parse_command(text)
+    command = _parse_command(lowered)
     if command:
         if command == "help":
             _webex_post_message(
@@ -558,12 +700,12 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
             )
             return {"statusCode": 200, "body": "help sent"}
         if command == "week":
-            _send_digest_list(room_id, message.get("personId", ""), days=7, title="[SB DIGEST] This Week")
+            _send_digest_list(state, room_id, person_id, days=7, title="[SB DIGEST] This Week")
             return {"statusCode": 200, "body": "weekly digest sent"}
         if command == "today":
-            _send_digest_list(room_id, message.get("personId", ""), days=1, title="[SB DIGEST] Today")
+            _send_digest_list(state, room_id, person_id, days=1, title="[SB DIGEST] Today")
             return {"statusCode": 200, "body": "daily digest sent"}
-        _send_digest_list(room_id, message.get("personId", ""), days=14, title="[SB DIGEST] Next Focus")
+        _send_digest_list(state, room_id, person_id, days=14, title="[SB DIGEST] Next Focus")
         return {"statusCode": 200, "body": "next digest sent"}
 
     fix_category = _parse_fix_category(text)
@@ -575,23 +717,26 @@ def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
         original_text = (original.get("text") or "").strip()
         if not original_text:
             return {"statusCode": 200, "body": "fix missing original text"}
-        _enqueue_text(f"{fix_category}: {original_text}")
-        processed = 0
-        if os.environ.get("SB_RUN_PIPELINE", "true").lower() == "true":
-            processed = _run_pipeline(room_id=room_id)
+        fixed_text = f"{fix_category}: {original_text}"
+        if _dispatch_capture(fixed_text, room_id):
+            return {"statusCode": 200, "body": json.dumps({"status": "fixed", "dispatched": True})}
+        processed = _capture_text(fixed_text, room_id)
         return {"statusCode": 200, "body": json.dumps({"status": "fixed", "processed": processed})}
 
-    processed_ids = _load_processed_ids()
-    if message_id not in processed_ids:
-        processed_ids.add(message_id)
-        _save_processed_ids(processed_ids)
-
-    _enqueue_text(text)
-    processed = 0
-    if os.environ.get("SB_RUN_PIPELINE", "true").lower() == "true":
-        processed = _run_pipeline(room_id=room_id)
+    # Remember the id only once the capture is handed off or done, so a
+    # redelivery after a failed run captures the message again.
+    if _dispatch_capture(text, room_id):
+        _remember_processed_id(message_id)
+        return {"statusCode": 200, "body": json.dumps({"status": "queued", "dispatched": True})}
+    processed = _capture_text(text, room_id)
+    _remember_processed_id(message_id)
 
     return {
         "statusCode": 200,
         "body": json.dumps({"status": "queued", "processed": processed}),
     }
+
+
+if ASYNC_CAPTURE:
+    # Create the boto3 client during init so the first webhook does not pay for it.
+    _lambda_client()
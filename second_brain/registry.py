@@ -1,7 +1,10 @@
 import importlib
+from functools import lru_cache
 from typing import Any
 
 
+# Class paths come from config, so there are only ever a handful of them.
+@lru_cache(maxsize=None)
 def load_class(path: str) -> type:
     if not path or "." not in path:
         raise ValueError(f"Invalid class path: {path}")